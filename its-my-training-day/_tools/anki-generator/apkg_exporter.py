@@ -4,10 +4,17 @@ APKG exporter for Anki cards.
 Exports generated cards to .apkg format using genanki library.
 """
 
+import functools
+import itertools
+import json
 import os
 import random
+import sqlite3
+import tempfile
+import time
+import zipfile
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from dataclasses import dataclass
 
 try:
@@ -24,6 +31,124 @@ except ImportError:
     from config import GeneratorConfig, DEFAULT_CONFIG, TRACK_DECK_IDS
 
 
+# Card styling shared by every exporter instance
+CLOZE_MODEL_CSS = '''
+            .card {
+                font-family: arial;
+                font-size: 20px;
+                text-align: center;
+                color: black;
+                background-color: white;
+            }
+            .cloze {
+                font-weight: bold;
+                color: blue;
+            }
+            code {
+                background-color: #f4f4f4;
+                padding: 2px 6px;
+                border-radius: 3px;
+                font-family: monospace;
+            }
+            '''
+
+BASIC_MODEL_CSS = '''
+            .card {
+                font-family: arial;
+                font-size: 20px;
+                text-align: center;
+                color: black;
+                background-color: white;
+            }
+            code {
+                background-color: #f4f4f4;
+                padding: 2px 6px;
+                border-radius: 3px;
+                font-family: monospace;
+            }
+            '''
+
+
+# Track and tag slugs use dashes where deck names use spaces
+_DASH_TO_SPACE = str.maketrans("-", " ")
+
+
+@functools.lru_cache(maxsize=None)
+def _deck_title(slug: str) -> str:
+    """Turn a track slug such as ``python-backend`` into ``Python Backend``."""
+    return slug.translate(_DASH_TO_SPACE).title()
+
+
+def ensure_output_dir(directory) -> None:
+    """Create ``directory`` (and parents) if it does not exist yet."""
+    os.makedirs(os.path.abspath(directory), exist_ok=True)
+
+
+if GENANKI_AVAILABLE:
+    class _ScratchDBPackage(genanki.Package):
+        """
+        genanki.Package that builds its intermediate SQLite file quickly.
+        
+        The collection database only exists long enough to be zipped, so
+        durability is irrelevant: syncing is disabled and the journal is
+        kept in memory. The scratch file is removed afterwards (genanki
+        leaves it behind).
+        
+        ``compression_level`` selects the archive's zlib level; None keeps
+        genanki's default of storing entries uncompressed.
+        
+        This mirrors ``genanki.Package.write_to_file`` and calls its
+        ``write_to_db(cursor, timestamp, id_gen)`` hook, which is why
+        requirements.txt pins genanki below 0.14.
+        """
+        
+        def __init__(self, deck_or_decks=None, media_files=None,
+                     compression_level: Optional[int] = None):
+            super().__init__(deck_or_decks, media_files)
+            self.compression_level = compression_level
+        
+        def write_to_file(self, file, timestamp: Optional[float] = None):
+            fd, db_path = tempfile.mkstemp(suffix='.anki2')
+            os.close(fd)
+            try:
+                conn = sqlite3.connect(db_path)
+                try:
+                    conn.execute("PRAGMA synchronous=OFF")
+                    conn.execute("PRAGMA journal_mode=MEMORY")
+                    conn.execute("PRAGMA temp_store=MEMORY")
+                    
+                    if timestamp is None:
+                        timestamp = time.time()
+                    id_gen = itertools.count(int(timestamp * 1000))
+                    
+                    with conn:
+                        self.write_to_db(conn.cursor(), timestamp, id_gen)
+                finally:
+                    conn.close()
+                
+                if self.compression_level is None:
+                    zip_kwargs = {'compression': zipfile.ZIP_STORED}
+                else:
+                    zip_kwargs = {
+                        'compression': zipfile.ZIP_DEFLATED,
+                        'compresslevel': self.compression_level,
+                    }
+                
+                with zipfile.ZipFile(file, 'w', **zip_kwargs) as outzip:
+                    outzip.write(db_path, 'collection.anki2')
+                    
+                    media_json = {
+                        idx: os.path.basename(path)
+                        for idx, path in enumerate(self.media_files)
+                    }
+                    outzip.writestr('media', json.dumps(media_json))
+                    
+                    for idx, path in enumerate(self.media_files):
+                        outzip.write(path, str(idx))
+            finally:
+                os.remove(db_path)
+
+
 @dataclass
 class ExportResult:
     """Result of an APKG export operation."""
@@ -49,14 +174,19 @@ class APKGExporter:
                 "Install it with: pip install genanki"
             )
         
-        # Create Anki models
+        # Anki models are constant, so every exporter shares one instance
         self._cloze_model = self._create_cloze_model()
         self._basic_model = self._create_basic_model()
+        
+        # Card types without an entry fall back to the basic model
+        self._model_by_type = {CardType.CLOZE: self._cloze_model}
     
-    def _create_cloze_model(self) -> 'genanki.Model':
-        """Create the cloze deletion model for Anki."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_cloze_model() -> 'genanki.Model':
+        """Create the cloze deletion model for Anki (built once, then shared)."""
         return genanki.Model(
-            self.CLOZE_MODEL_ID,
+            APKGExporter.CLOZE_MODEL_ID,
             'Interview Training Cloze',
             model_type=genanki.Model.CLOZE,
             fields=[
@@ -68,31 +198,15 @@ class APKGExporter:
                 'qfmt': '{{cloze:Text}}',
                 'afmt': '{{cloze:Text}}<br><br>{{Extra}}',
             }],
-            css='''
-            .card {
-                font-family: arial;
-                font-size: 20px;
-                text-align: center;
-                color: black;
-                background-color: white;
-            }
-            .cloze {
-                font-weight: bold;
-                color: blue;
-            }
-            code {
-                background-color: #f4f4f4;
-                padding: 2px 6px;
-                border-radius: 3px;
-                font-family: monospace;
-            }
-            '''
+            css=CLOZE_MODEL_CSS
         )
     
-    def _create_basic_model(self) -> 'genanki.Model':
-        """Create the basic Q&A model for Anki."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_basic_model() -> 'genanki.Model':
+        """Create the basic Q&A model for Anki (built once, then shared)."""
         return genanki.Model(
-            self.BASIC_MODEL_ID,
+            APKGExporter.BASIC_MODEL_ID,
             'Interview Training Basic',
             fields=[
                 {'name': 'Front'},
@@ -103,32 +217,24 @@ class APKGExporter:
                 'qfmt': '{{Front}}',
                 'afmt': '{{FrontSide}}<hr id="answer">{{Back}}',
             }],
-            css='''
-            .card {
-                font-family: arial;
-                font-size: 20px;
-                text-align: center;
-                color: black;
-                background-color: white;
-            }
-            code {
-                background-color: #f4f4f4;
-                padding: 2px 6px;
-                border-radius: 3px;
-                font-family: monospace;
-            }
-            '''
+            css=BASIC_MODEL_CSS
         )
 
     def export(
         self,
-        cards: List[AnkiCard],
+        cards: Iterable[AnkiCard],
         output_path: str,
         deck_name: Optional[str] = None,
         track: Optional[str] = None
     ) -> ExportResult:
-        """Export cards to an .apkg file."""
-        if not cards:
+        """Export cards to an .apkg file.
+        
+        ``cards`` may be any iterable, including a generator; it is consumed
+        exactly once.
+        """
+        cards = iter(cards)
+        first = next(cards, None)
+        if first is None:
             return ExportResult(
                 success=False,
                 output_path=output_path,
@@ -140,29 +246,40 @@ class APKGExporter:
             # Determine deck ID and name
             deck_id = self._get_deck_id(track)
             if deck_name is None:
-                deck_name = self._generate_deck_name(track, cards)
+                deck_name = self._generate_deck_name(track, [first])
             
             # Create deck
             deck = genanki.Deck(deck_id, deck_name)
             
-            # Add cards to deck
-            for card in cards:
-                note = self._create_note(card)
-                if note:
-                    deck.add_note(note)
+            # Add cards to deck in one list build rather than per-card
+            # add_note, with the Note class and model lookup bound once.
+            Note = genanki.Note
+            model_for = self._model_by_type.get
+            basic_model = self._basic_model
+            notes = [
+                Note(
+                    model=model_for(card.card_type, basic_model),
+                    fields=[card.front, card.back],
+                    tags=card.tags,
+                    guid=card.id
+                )
+                for card in itertools.chain((first,), cards)
+            ]
+            deck.notes = notes
             
             # Ensure output directory exists
-            output_dir = Path(output_path).parent
-            output_dir.mkdir(parents=True, exist_ok=True)
+            ensure_output_dir(os.path.dirname(output_path))
             
             # Create package and write to file
-            package = genanki.Package(deck)
+            package = _ScratchDBPackage(
+                deck, compression_level=self.config.compression_level
+            )
             package.write_to_file(output_path)
             
             return ExportResult(
                 success=True,
                 output_path=output_path,
-                card_count=len(cards)
+                card_count=len(notes)
             )
             
         except Exception as e:
@@ -184,35 +301,18 @@ class APKGExporter:
         prefix = self.config.deck_name_prefix
         
         if track:
-            track_name = track.replace("-", " ").title()
+            track_name = _deck_title(track)
             return f"{prefix}::{track_name}"
         
         # Try to get track from card tags
         if cards and cards[0].tags:
             for tag in cards[0].tags:
                 if tag in TRACK_DECK_IDS:
-                    track_name = tag.replace("-", " ").title()
+                    track_name = _deck_title(tag)
                     return f"{prefix}::{track_name}"
         
         return prefix
     
-    def _create_note(self, card: AnkiCard) -> Optional['genanki.Note']:
-        """Create a genanki Note from an AnkiCard."""
-        if card.card_type == CardType.CLOZE:
-            return genanki.Note(
-                model=self._cloze_model,
-                fields=[card.front, card.back],
-                tags=card.tags,
-                guid=card.id
-            )
-        else:
-            return genanki.Note(
-                model=self._basic_model,
-                fields=[card.front, card.back],
-                tags=card.tags,
-                guid=card.id
-            )
-    
     def get_card_tags(self, card: AnkiCard) -> List[str]:
         """Get the tags for a card."""
         return card.tags
@@ -245,51 +345,75 @@ class APKGReader:
         
         Note: genanki doesn't have built-in read support, so this uses
         the underlying SQLite database structure.
-        """
-        import sqlite3
-        import zipfile
-        import tempfile
-        import os
         
+        Notes are returned column-wise: ``result["fields"][i]`` and
+        ``result["tags_per_card"][i]`` are the field and tag tuples of the
+        i-th note.
+        """
         result = {
-            "cards": [],
+            "fields": [],
+            "tags_per_card": [],
             "tags": set(),
             "deck_name": None,
             "card_count": 0
         }
         
+        temp_db_path = None
         try:
-            # Extract the .apkg (it's a zip file)
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-                
-                # Read the SQLite database
-                db_path = os.path.join(temp_dir, 'collection.anki2')
-                if not os.path.exists(db_path):
+            # Read only the collection out of the .apkg (it's a zip file);
+            # media entries are never decompressed
+            with zipfile.ZipFile(file_path, 'r') as zip_ref:
+                if 'collection.anki2' not in zip_ref.namelist():
                     return result
-                
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-                
-                # Get notes (cards)
-                cursor.execute("SELECT flds, tags FROM notes")
-                for row in cursor.fetchall():
-                    fields = row[0].split('\x1f')  # Anki field separator
-                    tags = row[1].split() if row[1] else []
-                    
-                    result["cards"].append({
-                        "fields": fields,
-                        "tags": tags
-                    })
-                    result["tags"].update(tags)
-                
-                result["card_count"] = len(result["cards"])
-                result["tags"] = list(result["tags"])
-                
-                conn.close()
-                
+                db_bytes = zip_ref.read('collection.anki2')
+            
+            # Load the SQLite database straight from memory when supported,
+            # otherwise fall back to a single temporary file
+            if hasattr(sqlite3.Connection, "deserialize"):
+                conn = sqlite3.connect(":memory:")
+                conn.deserialize(db_bytes)
+            else:
+                with tempfile.NamedTemporaryFile(
+                    suffix='.anki2', delete=False
+                ) as temp_db:
+                    temp_db.write(db_bytes)
+                    temp_db_path = temp_db.name
+                # Read-only URI mode lets SQLite skip journal setup
+                conn = sqlite3.connect(
+                    f"{Path(temp_db_path).as_uri()}?mode=ro", uri=True
+                )
+            del db_bytes
+            cursor = conn.cursor()
+            
+            # Collect unique tags from distinct tag strings up front so
+            # the per-note loop below does not touch the tag set
+            cursor.execute("SELECT DISTINCT tags FROM notes")
+            result["tags"] = list({
+                tag
+                for (tag_str,) in cursor.fetchall() if tag_str
+                for tag in tag_str.split()
+            })
+            
+            # Get notes (cards), streamed in batches
+            fields = result["fields"]
+            tags_per_card = result["tags_per_card"]
+            cursor.execute("SELECT flds, tags FROM notes")
+            while True:
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                for flds, tag_str in rows:
+                    fields.append(tuple(flds.split('\x1f')))  # Anki field separator
+                    tags_per_card.append(tuple(tag_str.split()) if tag_str else ())
+            
+            result["card_count"] = len(fields)
+            
+            conn.close()
+            
         except Exception as e:
             result["error"] = str(e)
+        finally:
+            if temp_db_path is not None:
+                os.unlink(temp_db_path)
         
         return result
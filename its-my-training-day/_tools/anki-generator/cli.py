@@ -3,29 +3,69 @@ Command-line interface for the Anki card generator.
 
 Usage:
     python -m anki_generator generate --input <file> --output <dir> [options]
+    python -m anki_generator generate-all --input-dir <dir> --output <dir> [options]
 """
 
 import argparse
+import functools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import sys
 import os
 from pathlib import Path
-from datetime import datetime
-from typing import List, Optional
+from datetime import date
+from typing import List, Optional, Tuple
 
 try:
     from .markdown_parser import MarkdownParser
     from .concept_extractor import ConceptExtractor
     from .cloze_generator import ClozeGenerator
-    from .apkg_exporter import APKGExporter
+    from .apkg_exporter import APKGExporter, ExportResult, ensure_output_dir
     from .config import GeneratorConfig, DEFAULT_CONFIG
 except ImportError:
     from markdown_parser import MarkdownParser
     from concept_extractor import ConceptExtractor
     from cloze_generator import ClozeGenerator
-    from apkg_exporter import APKGExporter
+    from apkg_exporter import APKGExporter, ExportResult, ensure_output_dir
     from config import GeneratorConfig, DEFAULT_CONFIG
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_cached(path_str: str, mtime_ns: int, size: int):
+    """Parse a study guide, memoized on its path, mtime and size.
+
+    The stat fields are part of the key so an edited file is re-parsed.
+    """
+    return MarkdownParser().parse_file(path_str)
+
+
+# --compression choices mapped to GeneratorConfig.compression_level
+COMPRESSION_LEVELS = {
+    "none": None,
+    "fast": 1,
+    "default": 6,
+}
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that need an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"must be a positive integer, got {value!r}"
+        )
+    return number
+
+
+def _today_stamp() -> str:
+    """Return today's date as YYYYMMDD for output filenames."""
+    today = date.today()
+    return f"{today.year:04d}{today.month:02d}{today.day:02d}"
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
     parser = argparse.ArgumentParser(
@@ -80,12 +120,71 @@ def create_parser() -> argparse.ArgumentParser:
         help="Disable generation of reverse cards"
     )
     
+    gen_parser.add_argument(
+        "--compression",
+        choices=sorted(COMPRESSION_LEVELS),
+        default="none",
+        help="Compression for the .apkg archive (default: none, fastest to write)"
+    )
+    
     gen_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="Enable verbose output"
     )
     
+    # Generate-all command
+    all_parser = subparsers.add_parser(
+        "generate-all",
+        help="Generate one Anki deck per study guide in a directory"
+    )
+    
+    all_parser.add_argument(
+        "--input-dir", "-i",
+        required=True,
+        help="Directory searched recursively for study guide markdown files"
+    )
+    
+    all_parser.add_argument(
+        "--output", "-o",
+        required=True,
+        help="Output directory for the .apkg files"
+    )
+    
+    all_parser.add_argument(
+        "--min-cards",
+        type=int,
+        default=100,
+        help="Minimum number of cards to generate per deck (default: 100)"
+    )
+    
+    all_parser.add_argument(
+        "--tags",
+        type=str,
+        default="",
+        help="Comma-separated list of additional tags"
+    )
+    
+    all_parser.add_argument(
+        "--no-reverse",
+        action="store_true",
+        help="Disable generation of reverse cards"
+    )
+    
+    all_parser.add_argument(
+        "--compression",
+        choices=sorted(COMPRESSION_LEVELS),
+        default="none",
+        help="Compression for the .apkg archive (default: none, fastest to write)"
+    )
+    
+    all_parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)"
+    )
+    
     # Info command
     info_parser = subparsers.add_parser(
         "info",
@@ -117,23 +216,119 @@ def print_success(message: str):
     print(f"[✓] {message}")
 
 
+def _build_deck(
+    input_path: Path,
+    st: os.stat_result,
+    output_dir: str,
+    config: GeneratorConfig,
+    timestamp: str,
+    deck_name: Optional[str] = None,
+    verbose: bool = False,
+    topic_name: Optional[str] = None
+) -> Tuple[str, ExportResult]:
+    """Run the parse -> extract -> generate -> export pipeline for one guide.
+    
+    The output file is ``<topic_name>-<timestamp>.apkg``; ``topic_name``
+    defaults to the guide's slugified title.
+    """
+    # Parse the study guide
+    parsed = _parse_cached(str(input_path), st.st_mtime_ns, st.st_size)
+    
+    print_progress(f"Found {len(parsed.qa_pairs)} Q&A pairs", verbose)
+    print_progress(f"Track: {parsed.metadata.track}", verbose)
+    print_progress(f"Subdomain: {parsed.metadata.subdomain}", verbose)
+    
+    # Extract concepts
+    print_progress("Extracting concepts...", verbose)
+    extractor = ConceptExtractor()
+    concepts = extractor.extract_from_parsed_guide(parsed)
+    print_progress(f"Extracted {len(concepts)} concepts", verbose)
+    
+    # Generate cloze candidates
+    candidates = extractor.generate_cloze_candidates(concepts)
+    print_progress(f"Generated {len(candidates)} cloze candidates", verbose)
+    
+    # Generate cards
+    print_progress("Generating Anki cards...", verbose)
+    generator = ClozeGenerator(config)
+    
+    metadata = {
+        "track": parsed.metadata.track,
+        "subdomain": parsed.metadata.subdomain,
+        "difficulty": parsed.metadata.difficulty
+    }
+    
+    cards = generator.generate_cards_iter(
+        candidates,
+        metadata,
+        str(input_path)
+    )
+    
+    # Validate cards as they stream into the exporter, so the full card
+    # list is never held alongside the deck's notes
+    counts = Counter()
+    
+    def valid_cards():
+        validate = generator.validate_cloze_syntax
+        for card in cards:
+            counts["generated"] += 1
+            if validate(card):
+                yield card
+            else:
+                counts["invalid"] += 1
+    
+    # Export to APKG
+    print_progress("Exporting to APKG format...", verbose)
+    
+    # Generate output filename
+    if topic_name is None:
+        topic_name = parsed.metadata.title.lower().replace(" ", "-")
+    output_filename = f"{topic_name}-{timestamp}.apkg"
+    output_path = os.path.join(output_dir, output_filename)
+    
+    exporter = APKGExporter(config)
+    result = exporter.export(
+        valid_cards(),
+        output_path,
+        deck_name=deck_name,
+        track=parsed.metadata.track
+    )
+    
+    print_progress(f"Generated {counts['generated']} cards", verbose)
+    
+    if counts["invalid"] > 0:
+        print_progress(f"Filtered {counts['invalid']} invalid cards", verbose)
+    
+    valid_count = counts["generated"] - counts["invalid"]
+    if valid_count < config.min_cards:
+        print_error(
+            f"Could only generate {valid_count} valid cards "
+            f"(minimum: {config.min_cards}). "
+            "Consider adding more content to the study guide."
+        )
+    
+    return output_path, result
+
+
 def cmd_generate(args) -> int:
     """Execute the generate command."""
     verbose = args.verbose
     
     # Validate input file
-    input_path = Path(args.input)
-    if not input_path.exists():
+    try:
+        st = os.stat(args.input)
+    except OSError:
         print_error(f"Input file not found: {args.input}")
         return 1
     
-    if not input_path.suffix == ".md":
+    if not args.input.endswith(".md"):
         print_error(f"Input file must be a markdown file (.md): {args.input}")
         return 1
+    input_path = Path(args.input)
     
     # Create output directory if needed
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = args.output
+    ensure_output_dir(output_dir)
     
     # Parse additional tags
     additional_tags = [t.strip() for t in args.tags.split(",") if t.strip()]
@@ -142,83 +337,21 @@ def cmd_generate(args) -> int:
     config = GeneratorConfig(
         min_cards=args.min_cards,
         generate_reverse_cards=not args.no_reverse,
-        default_tags=additional_tags
+        default_tags=additional_tags,
+        compression_level=COMPRESSION_LEVELS[args.compression]
     )
     
     print_progress(f"Parsing study guide: {input_path.name}", verbose)
     
     try:
-        # Parse the study guide
-        parser = MarkdownParser()
-        parsed = parser.parse_file(str(input_path))
-        
-        print_progress(f"Found {len(parsed.qa_pairs)} Q&A pairs", verbose)
-        print_progress(f"Track: {parsed.metadata.track}", verbose)
-        print_progress(f"Subdomain: {parsed.metadata.subdomain}", verbose)
-        
-        # Extract concepts
-        print_progress("Extracting concepts...", verbose)
-        extractor = ConceptExtractor()
-        concepts = extractor.extract_from_parsed_guide(parsed)
-        print_progress(f"Extracted {len(concepts)} concepts", verbose)
-        
-        # Generate cloze candidates
-        candidates = extractor.generate_cloze_candidates(concepts)
-        print_progress(f"Generated {len(candidates)} cloze candidates", verbose)
-        
-        # Generate cards
-        print_progress("Generating Anki cards...", verbose)
-        generator = ClozeGenerator(config)
-        
-        metadata = {
-            "track": parsed.metadata.track,
-            "subdomain": parsed.metadata.subdomain,
-            "difficulty": parsed.metadata.difficulty
-        }
-        
-        cards = generator.generate_cards(
-            candidates,
-            metadata,
-            str(input_path)
-        )
-        
-        print_progress(f"Generated {len(cards)} cards", verbose)
-        
-        # Validate cards
-        valid_cards = []
-        invalid_count = 0
-        for card in cards:
-            if generator.validate_cloze_syntax(card):
-                valid_cards.append(card)
-            else:
-                invalid_count += 1
-        
-        if invalid_count > 0:
-            print_progress(f"Filtered {invalid_count} invalid cards", verbose)
-        
-        if len(valid_cards) < config.min_cards:
-            print_error(
-                f"Could only generate {len(valid_cards)} valid cards "
-                f"(minimum: {config.min_cards}). "
-                "Consider adding more content to the study guide."
-            )
-            # Continue anyway with what we have
-        
-        # Export to APKG
-        print_progress("Exporting to APKG format...", verbose)
-        
-        # Generate output filename
-        timestamp = datetime.now().strftime("%Y%m%d")
-        topic_name = parsed.metadata.title.lower().replace(" ", "-")
-        output_filename = f"{topic_name}-{timestamp}.apkg"
-        output_path = output_dir / output_filename
-        
-        exporter = APKGExporter(config)
-        result = exporter.export(
-            valid_cards,
-            str(output_path),
+        output_path, result = _build_deck(
+            input_path,
+            st,
+            output_dir,
+            config,
+            _today_stamp(),
             deck_name=args.deck_name,
-            track=parsed.metadata.track
+            verbose=verbose
         )
         
         if result.success:
@@ -240,17 +373,131 @@ def cmd_generate(args) -> int:
         return 1
 
 
+def _topic_name_for(path: Path, input_dir: Path) -> str:
+    """Output-name slug for a guide, built from its path under ``input_dir``.
+    
+    Titles can repeat (or be empty) across guides, so batch runs name
+    decks after the source path instead: ``python/async-io.md`` becomes
+    ``python-async-io``.
+    """
+    relative = path.relative_to(input_dir).with_suffix("")
+    return "-".join(relative.parts).lower().replace(" ", "-")
+
+
+def _export_one(
+    path_str: str,
+    output_dir: str,
+    config: GeneratorConfig,
+    timestamp: str,
+    topic_name: str
+) -> Tuple[str, Optional[ExportResult]]:
+    """Build the deck for a single guide; runs inside a worker process.
+    
+    Returns ``None`` as the result for markdown files without Q&A pairs.
+    """
+    try:
+        st = os.stat(path_str)
+        parsed = _parse_cached(path_str, st.st_mtime_ns, st.st_size)
+        if not parsed.qa_pairs:
+            return path_str, None
+        output_path, result = _build_deck(
+            Path(path_str), st, output_dir, config, timestamp,
+            topic_name=topic_name
+        )
+    except Exception as e:
+        return path_str, ExportResult(
+            success=False,
+            output_path="",
+            card_count=0,
+            error_message=str(e)
+        )
+    return path_str, result
+
+
+def cmd_generate_all(args) -> int:
+    """Execute the generate-all command."""
+    input_dir = Path(args.input_dir)
+    if not input_dir.is_dir():
+        print_error(f"Input directory not found: {args.input_dir}")
+        return 1
+    
+    paths = sorted(input_dir.rglob("*.md"))
+    if not paths:
+        print_error(f"No markdown files found in {args.input_dir}")
+        return 1
+    
+    # Workers write in parallel, so two guides mapping to one file would
+    # silently overwrite each other; refuse the batch instead
+    topic_names = {str(p): _topic_name_for(p, input_dir) for p in paths}
+    sources_by_topic = {}
+    for path_str, topic_name in topic_names.items():
+        sources_by_topic.setdefault(topic_name, []).append(path_str)
+    clashes = [
+        sources for sources in sources_by_topic.values() if len(sources) > 1
+    ]
+    if clashes:
+        for sources in clashes:
+            print_error(f"Guides share an output name: {', '.join(sources)}")
+        return 1
+    
+    ensure_output_dir(args.output)
+    
+    additional_tags = [t.strip() for t in args.tags.split(",") if t.strip()]
+    config = GeneratorConfig(
+        min_cards=args.min_cards,
+        generate_reverse_cards=not args.no_reverse,
+        default_tags=additional_tags,
+        compression_level=COMPRESSION_LEVELS[args.compression]
+    )
+    
+    print_progress(f"Generating {len(paths)} decks")
+    
+    # One date stamp for the whole batch, even if it runs past midnight
+    timestamp = _today_stamp()
+    
+    # Each guide is independent, so the decks are built in parallel
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count()) as pool:
+        futures = [
+            pool.submit(
+                _export_one, path_str, args.output, config, timestamp,
+                topic_name
+            )
+            for path_str, topic_name in topic_names.items()
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+    
+    failed = 0
+    skipped = 0
+    total_cards = 0
+    for path, result in sorted(results, key=lambda item: item[0]):
+        if result is None:
+            skipped += 1
+        elif result.success:
+            total_cards += result.card_count
+            print_success(f"{result.output_path} ({result.card_count} cards)")
+        else:
+            failed += 1
+            print_error(f"{path}: {result.error_message}")
+    
+    created = len(results) - failed - skipped
+    print(f"\nDecks: {created} created, {failed} failed, {skipped} skipped")
+    print(f"Total cards: {total_cards}")
+    return 1 if failed else 0
+
+
 def cmd_info(args) -> int:
     """Execute the info command."""
-    input_path = Path(args.input)
-    
-    if not input_path.exists():
+    try:
+        st = os.stat(args.input)
+    except OSError:
         print_error(f"Input file not found: {args.input}")
         return 1
+    input_path = Path(args.input)
     
     try:
-        parser = MarkdownParser()
-        parsed = parser.parse_file(str(input_path))
+        parsed = _parse_cached(str(input_path), st.st_mtime_ns, st.st_size)
         
         print(f"\n{'='*50}")
         print(f"Study Guide: {parsed.metadata.title}")
@@ -264,15 +511,21 @@ def cmd_info(args) -> int:
         print(f"Q&A Pairs:      {len(parsed.qa_pairs)}")
         
         print(f"\nQuestions:")
-        for qa in parsed.qa_pairs:
+        
+        # Print each question and gather its concepts in the same pass
+        extractor = ConceptExtractor()
+        all_concepts = []
+        for qa, qa_concepts in extractor.iter_concepts_with_meta(parsed):
+            all_concepts.extend(qa_concepts)
+            if qa is None:
+                continue
             print(f"  Q{qa.question_number}: {qa.question[:60]}...")
             print(f"    - Key concepts: {len(qa.key_concepts)}")
             print(f"    - Code blocks: {len(qa.code_blocks)}")
             print(f"    - Follow-ups: {len(qa.follow_up_questions)}")
         
         # Estimate card count
-        extractor = ConceptExtractor()
-        concepts = extractor.extract_from_parsed_guide(parsed)
+        concepts = extractor.unique_concepts(all_concepts)
         candidates = extractor.generate_cloze_candidates(concepts)
         
         print(f"\nEstimated Cards:")
@@ -298,6 +551,8 @@ def main(argv: Optional[List[str]] = None) -> int:
     
     if args.command == "generate":
         return cmd_generate(args)
+    elif args.command == "generate-all":
+        return cmd_generate_all(args)
     elif args.command == "info":
         return cmd_info(args)
     else:
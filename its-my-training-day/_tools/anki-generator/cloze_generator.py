@@ -5,17 +5,41 @@ Creates cloze deletion cards with valid Anki syntax from extracted concepts.
 """
 
 import re
+import functools
 import hashlib
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from enum import Enum
 
 try:
     from .concept_extractor import Concept, ConceptType, ClozeCandidate
-    from .config import GeneratorConfig, DEFAULT_CONFIG
+    from .config import GeneratorConfig, DEFAULT_CONFIG, DATACLASS_SLOTS
 except ImportError:
     from concept_extractor import Concept, ConceptType, ClozeCandidate
-    from config import GeneratorConfig, DEFAULT_CONFIG
+    from config import GeneratorConfig, DEFAULT_CONFIG, DATACLASS_SLOTS
+
+
+_CLOZE_OPEN_PATTERN = re.compile(r"\{\{c\d+::")
+
+# Card ids only need a stable digest, not a secure one; the
+# usedforsecurity flag (3.9+) keeps MD5 usable on FIPS-restricted builds
+if sys.version_info >= (3, 9):
+    _new_md5 = functools.partial(hashlib.md5, usedforsecurity=False)
+else:
+    _new_md5 = hashlib.md5
+
+
+@functools.lru_cache(maxsize=1024)
+def _prepare_cloze_text(text: str) -> Tuple[str, str]:
+    """Return a candidate's escaped cloze text and its lowercase form.
+    
+    The same candidate is clozed by several card strategies, so the
+    escaping and lowercasing are done once per distinct text.
+    """
+    # Remove any existing cloze syntax
+    escaped = _CLOZE_OPEN_PATTERN.sub("", text).replace("}}", "").strip()
+    return escaped, escaped.lower()
 
 
 class CardType(Enum):
@@ -24,7 +48,7 @@ class CardType(Enum):
     BASIC = "basic"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AnkiCard:
     """An Anki flashcard."""
     id: str
@@ -34,9 +58,15 @@ class AnkiCard:
     source_file: str = ""
     card_type: CardType = CardType.CLOZE
     source_question: Optional[int] = None
+    # Set in __post_init__; declared so it gets a slot
+    _id_hash: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Cards are keyed on their id, which is fixed once generated
+        self._id_hash = hash(self.id)
     
     def __hash__(self):
-        return hash(self.id)
+        return self._id_hash
     
     def __eq__(self, other):
         if not isinstance(other, AnkiCard):
@@ -49,9 +79,15 @@ class ClozeGenerator:
     
     # Anki cloze syntax pattern
     CLOZE_PATTERN = re.compile(r"\{\{c(\d+)::([^}]+)\}\}")
+    # Single-group variants of CLOZE_PATTERN, so findall returns the
+    # numbers or the hidden text directly without building match objects
+    CLOZE_NUMBER_PATTERN = re.compile(r"\{\{c(\d+)::[^}]+\}\}")
+    CLOZE_CONTENT_PATTERN = re.compile(r"\{\{c\d+::([^}]+)\}\}")
     
     def __init__(self, config: Optional[GeneratorConfig] = None):
         self.config = config or DEFAULT_CONFIG
+        # MD5 states already fed "<source><suffix>:"; see _generate_card_id
+        self._id_seeds: Dict[Tuple[str, str], "hashlib._Hash"] = {}
     
     def generate_cards(
         self,
@@ -60,8 +96,18 @@ class ClozeGenerator:
         source_file: str = ""
     ) -> List[AnkiCard]:
         """Generate Anki cards from cloze candidates."""
-        cards = []
+        return list(self.generate_cards_iter(candidates, metadata, source_file))
+    
+    def generate_cards_iter(
+        self,
+        candidates: List[ClozeCandidate],
+        metadata: dict,
+        source_file: str = ""
+    ) -> Iterator[AnkiCard]:
+        """Yield Anki cards from cloze candidates as they are generated."""
+        count = 0
         seen_fronts: Set[str] = set()
+        seen_reverse: Set[Tuple[ConceptType, str, str]] = set()
         
         # Build base tags from metadata
         base_tags = self._build_tags(metadata)
@@ -73,35 +119,47 @@ class ClozeGenerator:
                 candidate, 
                 base_tags, 
                 source_file,
-                is_reverse=False
+                is_reverse=False,
+                seen_fronts=seen_fronts
             )
-            if forward_card and forward_card.front not in seen_fronts:
-                cards.append(forward_card)
+            if forward_card:
+                count += 1
                 seen_fronts.add(forward_card.front)
+                yield forward_card
             
-            # Generate reverse card if enabled
+            # Generate reverse card if enabled. A reverse front is built
+            # only from these fields, so a repeat would just be rejected as
+            # a duplicate after formatting; skip it up front instead
             if self.config.generate_reverse_cards:
+                reverse_key = (
+                    candidate.cloze_type,
+                    candidate.full_text,
+                    candidate.cloze_text
+                )
+                if reverse_key in seen_reverse:
+                    continue
+                seen_reverse.add(reverse_key)
+                
                 reverse_card = self._create_reverse_card(
                     candidate,
                     base_tags,
-                    source_file
+                    source_file,
+                    seen_fronts=seen_fronts
                 )
-                if reverse_card and reverse_card.front not in seen_fronts:
-                    cards.append(reverse_card)
+                if reverse_card:
+                    count += 1
                     seen_fronts.add(reverse_card.front)
+                    yield reverse_card
         
         # If we don't have enough cards, generate additional variations
-        if len(cards) < self.config.min_cards:
-            additional = self._generate_additional_cards(
+        if count < self.config.min_cards:
+            yield from self._generate_additional_cards(
                 candidates, 
                 base_tags, 
                 source_file,
                 seen_fronts,
-                self.config.min_cards - len(cards)
+                self.config.min_cards - count
             )
-            cards.extend(additional)
-        
-        return cards
     
     def _build_tags(self, metadata: dict) -> List[str]:
         """Build tags from metadata."""
@@ -121,23 +179,23 @@ class ClozeGenerator:
         candidate: ClozeCandidate,
         tags: List[str],
         source_file: str,
-        is_reverse: bool = False
+        is_reverse: bool = False,
+        seen_fronts: Optional[Set[str]] = None
     ) -> Optional[AnkiCard]:
         """Create a cloze deletion card from a candidate."""
         # Escape special characters in cloze text
-        cloze_text = self._escape_cloze_text(candidate.cloze_text)
+        cloze_text, cloze_lower = _prepare_cloze_text(candidate.cloze_text)
         full_text = candidate.full_text
         
-        # Check if cloze text exists in full text
-        if cloze_text.lower() not in full_text.lower():
-            return None
-        
-        # Create cloze deletion
-        cloze_front = self._apply_cloze_deletion(full_text, cloze_text, 1)
+        # Create cloze deletion (None when the cloze text is not in the text)
+        cloze_front = self._apply_cloze_deletion(full_text, cloze_text, 1, cloze_lower)
         
         if not cloze_front:
             return None
         
+        if seen_fronts is not None and cloze_front in seen_fronts:
+            return None  # Duplicate; skip hashing the id
+        
         # Generate unique ID
         card_id = self._generate_card_id(cloze_front, source_file)
         
@@ -160,7 +218,8 @@ class ClozeGenerator:
         self,
         candidate: ClozeCandidate,
         tags: List[str],
-        source_file: str
+        source_file: str,
+        seen_fronts: Optional[Set[str]] = None
     ) -> Optional[AnkiCard]:
         """Create a reverse card (definition -> concept)."""
         # Only create reverse for terms and definitions
@@ -181,7 +240,10 @@ class ClozeGenerator:
             front = f"Define: {candidate.cloze_text}"
             back = candidate.full_text
         
-        card_id = self._generate_card_id(front, source_file + "_reverse")
+        if seen_fronts is not None and front in seen_fronts:
+            return None  # Duplicate; skip hashing the id
+        
+        card_id = self._generate_card_id(front, source_file, "_reverse")
         card_tags = tags + ["reverse", f"type::{candidate.cloze_type.value}"]
         
         return AnkiCard(
@@ -194,33 +256,58 @@ class ClozeGenerator:
             source_question=candidate.source_question
         )
     
-    def _apply_cloze_deletion(self, text: str, cloze_text: str, cloze_num: int) -> Optional[str]:
+    def _apply_cloze_deletion(
+        self,
+        text: str,
+        cloze_text: str,
+        cloze_num: int,
+        cloze_lower: Optional[str] = None
+    ) -> Optional[str]:
         """Apply cloze deletion syntax to text."""
         # Find the cloze text in the full text (case-insensitive)
-        pattern = re.compile(re.escape(cloze_text), re.IGNORECASE)
-        match = pattern.search(text)
-        
-        if not match:
-            return None
+        text_lower = text.lower()
+        if cloze_lower is None:
+            cloze_lower = cloze_text.lower()
+        if len(text_lower) == len(text) and len(cloze_lower) == len(cloze_text):
+            start = text_lower.find(cloze_lower)
+            if start < 0:
+                return None
+            end = start + len(cloze_text)
+        else:
+            # Lowercasing changed the length (e.g. "İ"), so offsets in
+            # text_lower don't line up with text; let the regex match instead
+            match = re.search(re.escape(cloze_text), text, re.IGNORECASE)
+            if not match:
+                return None
+            start, end = match.span()
         
         # Replace with cloze syntax
-        actual_text = match.group()
+        actual_text = text[start:end]
         cloze_syntax = f"{{{{c{cloze_num}::{actual_text}}}}}"
         
-        result = text[:match.start()] + cloze_syntax + text[match.end():]
+        result = text[:start] + cloze_syntax + text[end:]
         return result
     
-    def _escape_cloze_text(self, text: str) -> str:
-        """Escape special characters for cloze text."""
-        # Remove any existing cloze syntax
-        text = re.sub(r"\{\{c\d+::", "", text)
-        text = text.replace("}}", "")
-        return text.strip()
-    
-    def _generate_card_id(self, content: str, source: str) -> str:
+    def _generate_card_id(self, content: str, source: str, suffix: str = "") -> str:
         """Generate a unique ID for a card."""
-        combined = f"{source}:{content}"
-        return hashlib.md5(combined.encode()).hexdigest()[:16]
+        # The id becomes the note GUID in the exported deck, so the digest
+        # must stay MD5 or re-imports would duplicate every note; it is not
+        # a security boundary, which lets FIPS-restricted builds use it too.
+        # Every card from one source and strategy shares the
+        # "<source><suffix>:" prefix, so that part is hashed once and each id
+        # starts from a copy of the state. Passing the suffix separately
+        # keeps callers from building source + suffix for every card.
+        key = (source, suffix)
+        seed = self._id_seeds.get(key)
+        if seed is None:
+            seed = _new_md5()
+            seed.update(source.encode())
+            seed.update(suffix.encode())
+            seed.update(b":")
+            self._id_seeds[key] = seed
+        hasher = seed.copy()
+        hasher.update(content.encode())
+        return hasher.hexdigest()[:16]
     
     def _generate_additional_cards(
         self,
@@ -244,12 +331,11 @@ class ClozeGenerator:
             if c2:
                 # Create multi-cloze even with different contexts
                 multi_card = self._create_multi_cloze_card(
-                    [c1, c2], tags, source_file
+                    [c1, c2], tags, source_file, seen_fronts
                 )
-                if multi_card and multi_card.front not in seen_fronts:
+                if multi_card:
                     additional.append(multi_card)
                     seen_fronts.add(multi_card.front)
-                    seen_fronts.add(multi_card.front)
         
         # Strategy 2: Create fill-in-the-blank variations
         for candidate in candidates:
@@ -257,9 +343,9 @@ class ClozeGenerator:
                 break
             
             fill_card = self._create_fill_blank_card(
-                candidate, tags, source_file
+                candidate, tags, source_file, seen_fronts
             )
-            if fill_card and fill_card.front not in seen_fronts:
+            if fill_card:
                 additional.append(fill_card)
                 seen_fronts.add(fill_card.front)
         
@@ -268,8 +354,8 @@ class ClozeGenerator:
             if len(additional) >= needed:
                 break
             
-            qa_card = self._create_qa_card(candidate, tags, source_file)
-            if qa_card and qa_card.front not in seen_fronts:
+            qa_card = self._create_qa_card(candidate, tags, source_file, seen_fronts)
+            if qa_card:
                 additional.append(qa_card)
                 seen_fronts.add(qa_card.front)
         
@@ -278,8 +364,8 @@ class ClozeGenerator:
             if len(additional) >= needed:
                 break
             
-            tf_card = self._create_true_false_card(candidate, tags, source_file)
-            if tf_card and tf_card.front not in seen_fronts:
+            tf_card = self._create_true_false_card(candidate, tags, source_file, seen_fronts)
+            if tf_card:
                 additional.append(tf_card)
                 seen_fronts.add(tf_card.front)
         
@@ -288,8 +374,10 @@ class ClozeGenerator:
             if len(additional) >= needed:
                 break
             
-            complete_card = self._create_complete_sentence_card(candidate, tags, source_file)
-            if complete_card and complete_card.front not in seen_fronts:
+            complete_card = self._create_complete_sentence_card(
+                candidate, tags, source_file, seen_fronts
+            )
+            if complete_card:
                 additional.append(complete_card)
                 seen_fronts.add(complete_card.front)
         
@@ -299,7 +387,8 @@ class ClozeGenerator:
         self,
         candidates: List[ClozeCandidate],
         tags: List[str],
-        source_file: str
+        source_file: str,
+        seen_fronts: Optional[Set[str]] = None
     ) -> Optional[AnkiCard]:
         """Create a card with multiple cloze deletions."""
         if not candidates:
@@ -308,10 +397,13 @@ class ClozeGenerator:
         text = candidates[0].full_text
         
         for i, candidate in enumerate(candidates, 1):
-            cloze_text = self._escape_cloze_text(candidate.cloze_text)
-            text = self._apply_cloze_deletion(text, cloze_text, i) or text
+            cloze_text, cloze_lower = _prepare_cloze_text(candidate.cloze_text)
+            text = self._apply_cloze_deletion(text, cloze_text, i, cloze_lower) or text
+        
+        if seen_fronts is not None and text in seen_fronts:
+            return None  # Duplicate; skip hashing the id
         
-        card_id = self._generate_card_id(text, source_file + "_multi")
+        card_id = self._generate_card_id(text, source_file, "_multi")
         
         return AnkiCard(
             id=card_id,
@@ -326,7 +418,8 @@ class ClozeGenerator:
         self,
         candidate: ClozeCandidate,
         tags: List[str],
-        source_file: str
+        source_file: str,
+        seen_fronts: Optional[Set[str]] = None
     ) -> Optional[AnkiCard]:
         """Create a fill-in-the-blank style card."""
         context = candidate.full_text
@@ -339,7 +432,10 @@ class ClozeGenerator:
         
         front = f"Fill in the blank: {front}"
         
-        card_id = self._generate_card_id(front, source_file + "_fill")
+        if seen_fronts is not None and front in seen_fronts:
+            return None  # Duplicate; skip hashing the id
+        
+        card_id = self._generate_card_id(front, source_file, "_fill")
         
         return AnkiCard(
             id=card_id,
@@ -355,7 +451,8 @@ class ClozeGenerator:
         self,
         candidate: ClozeCandidate,
         tags: List[str],
-        source_file: str
+        source_file: str,
+        seen_fronts: Optional[Set[str]] = None
     ) -> Optional[AnkiCard]:
         """Create a question-answer card from context."""
         if candidate.cloze_type == ConceptType.TERM:
@@ -367,7 +464,10 @@ class ClozeGenerator:
         else:
             return None
         
-        card_id = self._generate_card_id(front, source_file + "_qa")
+        if seen_fronts is not None and front in seen_fronts:
+            return None  # Duplicate; skip hashing the id
+        
+        card_id = self._generate_card_id(front, source_file, "_qa")
         
         return AnkiCard(
             id=card_id,
@@ -384,31 +484,31 @@ class ClozeGenerator:
         if card.card_type != CardType.CLOZE:
             return True  # Non-cloze cards don't need cloze syntax
         
-        # Check for valid cloze pattern
-        matches = self.CLOZE_PATTERN.findall(card.front)
-        
-        if not matches:
+        return self._has_sequential_clozes(card.front)
+    
+    def _has_sequential_clozes(self, front: str) -> bool:
+        """Check that front has clozes numbered exactly 1..n, each once."""
+        numbers = self.CLOZE_NUMBER_PATTERN.findall(front)
+        if not numbers:
             return False
+        seen = set(map(int, numbers))
         
-        # Verify cloze numbers are sequential starting from 1
-        cloze_nums = sorted(int(m[0]) for m in matches)
-        expected = list(range(1, len(cloze_nums) + 1))
-        
-        return cloze_nums == expected
+        # n distinct positive numbers whose maximum is n are exactly 1..n
+        return 0 not in seen and len(numbers) == len(seen) == max(seen)
     
     def get_cloze_content(self, card: AnkiCard) -> List[str]:
         """Extract the content hidden by cloze deletions."""
         if card.card_type != CardType.CLOZE:
             return []
         
-        matches = self.CLOZE_PATTERN.findall(card.front)
-        return [m[1] for m in matches]
+        return self.CLOZE_CONTENT_PATTERN.findall(card.front)
 
     def _create_true_false_card(
         self,
         candidate: ClozeCandidate,
         tags: List[str],
-        source_file: str
+        source_file: str,
+        seen_fronts: Optional[Set[str]] = None
     ) -> Optional[AnkiCard]:
         """Create a true/false style card."""
         context = candidate.full_text
@@ -418,7 +518,10 @@ class ClozeGenerator:
         front = f"True or False: The following statement contains '{term}': {context}"
         back = "True"
         
-        card_id = self._generate_card_id(front, source_file + "_tf")
+        if seen_fronts is not None and front in seen_fronts:
+            return None  # Duplicate; skip hashing the id
+        
+        card_id = self._generate_card_id(front, source_file, "_tf")
         
         return AnkiCard(
             id=card_id,
@@ -434,21 +537,25 @@ class ClozeGenerator:
         self,
         candidate: ClozeCandidate,
         tags: List[str],
-        source_file: str
+        source_file: str,
+        seen_fronts: Optional[Set[str]] = None
     ) -> Optional[AnkiCard]:
         """Create a complete-the-sentence style card."""
         context = candidate.full_text
         term = candidate.cloze_text
         
-        # Split context at the term
-        parts = context.split(term, 1)
-        if len(parts) != 2:
+        # Split context at the first occurrence of the term
+        index = context.find(term)
+        if index < 0:
             return None
         
-        front = f"Complete: {parts[0]}..."
-        back = f"{term}{parts[1]}"
+        front = f"Complete: {context[:index]}..."
+        back = f"{term}{context[index + len(term):]}"
+        
+        if seen_fronts is not None and front in seen_fronts:
+            return None  # Duplicate; skip hashing the id
         
-        card_id = self._generate_card_id(front, source_file + "_complete")
+        card_id = self._generate_card_id(front, source_file, "_complete")
         
         return AnkiCard(
             id=card_id,
@@ -4,15 +4,36 @@ Concept extractor for study guide content.
 Identifies key terms, definitions, code patterns, and generates cloze deletion candidates.
 """
 
+import bisect
+import functools
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
 from enum import Enum
 
 try:
-    from .config import TECHNICAL_TERMS
+    from .config import TECHNICAL_TERMS, DATACLASS_SLOTS
 except ImportError:
-    from config import TECHNICAL_TERMS
+    from config import TECHNICAL_TERMS, DATACLASS_SLOTS
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_term_matchers(terms: FrozenSet[str]) -> Dict[str, Tuple[str, Pattern[str]]]:
+    """
+    Map each technical term to its lowercase form and a compiled
+    case-insensitive pattern. Cached because every extractor shares the
+    default terms.
+    """
+    return {
+        term: (term.lower(), re.compile(re.escape(term), re.IGNORECASE))
+        for term in terms
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _letter_count_hint(length: int) -> str:
+    """Hint for a term cloze; one shared string per length."""
+    return f"({length} letters)"
 
 
 class ConceptType(Enum):
@@ -45,7 +66,7 @@ class Concept:
                 self.source_question == other.source_question)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ClozeCandidate:
     """A candidate for cloze deletion card generation."""
     full_text: str  # The complete sentence/context
@@ -64,31 +85,49 @@ class ConceptExtractor:
     NUMBERED_LIST_PATTERN = re.compile(r"^\s*\d+\.\s*\*\*(.+?)\*\*\s*[-–:]\s*(.+)$", re.MULTILINE)
     BULLET_DEFINITION_PATTERN = re.compile(r"^\s*[-•]\s*\*\*(.+?)\*\*\s*[-–:]\s*(.+)$", re.MULTILINE)
     SENTENCE_PATTERN = re.compile(r"[^.!?]*[.!?]")
+    FUNCTION_NAME_PATTERN = re.compile(r"(?:def|function|const|let|var)\s+(\w+)")
+    CLASS_NAME_PATTERN = re.compile(r"class\s+(\w+)")
     
     def __init__(self, technical_terms: Optional[Set[str]] = None):
         self.technical_terms = technical_terms or TECHNICAL_TERMS
+        
+        # (term, lowercase term, compiled pattern) in technical_terms order
+        matchers = _compile_term_matchers(frozenset(self.technical_terms))
+        self._term_matchers = [(term,) + matchers[term] for term in self.technical_terms]
     
     def extract_from_parsed_guide(self, parsed_guide) -> List[Concept]:
         """Extract all concepts from a parsed study guide."""
-        concepts = []
+        return self.unique_concepts(
+            concept
+            for _, qa_concepts in self.iter_concepts_with_meta(parsed_guide)
+            for concept in qa_concepts
+        )
+    
+    def iter_concepts_with_meta(self, parsed_guide) -> Iterator[Tuple[Any, List[Concept]]]:
+        """
+        Yield ``(qa, concepts)`` for each part of a parsed study guide.
         
+        The overview comes first with ``qa`` set to ``None``, followed by one
+        entry per Q&A pair. Concepts are not deduplicated across entries;
+        pass the combined list through ``unique_concepts`` for that.
+        """
         # Extract from overview
         if parsed_guide.overview:
-            concepts.extend(self._extract_from_text(
+            yield None, self._extract_from_text(
                 parsed_guide.overview, 
                 source_question=None
-            ))
+            )
         
         # Extract from each Q&A pair
         for qa in parsed_guide.qa_pairs:
             # Question itself is a concept
-            concepts.append(Concept(
+            concepts = [Concept(
                 text=qa.question,
                 concept_type=ConceptType.QUESTION,
                 context=qa.question,
                 source_question=qa.question_number,
                 importance=3
-            ))
+            )]
             
             # Extract from answer
             concepts.extend(self._extract_from_text(
@@ -112,25 +151,34 @@ class ConceptExtractor:
                     code,
                     source_question=qa.question_number
                 ))
-        
-        # Deduplicate while preserving order
-        seen = set()
-        unique_concepts = []
+            
+            yield qa, concepts
+    
+    def unique_concepts(self, concepts: Iterable[Concept]) -> List[Concept]:
+        """Deduplicate concepts while preserving order."""
+        # Keyed on the fields Concept.__eq__ compares; the dict keeps the
+        # first concept per key in insertion order
+        unique: Dict[Tuple[str, ConceptType, Optional[int]], Concept] = {}
         for c in concepts:
-            if c not in seen:
-                seen.add(c)
-                unique_concepts.append(c)
+            unique.setdefault((c.text, c.concept_type, c.source_question), c)
         
-        return unique_concepts
+        return list(unique.values())
 
     def _extract_from_text(self, text: str, source_question: Optional[int] = None) -> List[Concept]:
         """Extract concepts from a text block."""
         concepts = []
+        sentences = self._sentence_spans(text)
+        
+        # The bold, numbered and bullet patterns all need "**" and the
+        # inline-code pattern needs a backtick; one substring check each
+        # lets plain prose skip those regex scans entirely
+        has_bold = "**" in text
+        has_code = "`" in text
         
         # Extract bold terms (usually important)
-        for match in self.BOLD_PATTERN.finditer(text):
+        for match in self.BOLD_PATTERN.finditer(text) if has_bold else ():
             term = match.group(1)
-            context = self._get_sentence_context(text, match.start())
+            context = self._get_sentence_context(text, match.start(), sentences)
             concepts.append(Concept(
                 text=term,
                 concept_type=ConceptType.TERM,
@@ -140,10 +188,10 @@ class ConceptExtractor:
             ))
         
         # Extract inline code
-        for match in self.CODE_INLINE_PATTERN.finditer(text):
+        for match in self.CODE_INLINE_PATTERN.finditer(text) if has_code else ():
             code = match.group(1)
             if len(code) > 2:  # Skip very short code
-                context = self._get_sentence_context(text, match.start())
+                context = self._get_sentence_context(text, match.start(), sentences)
                 concepts.append(Concept(
                     text=code,
                     concept_type=ConceptType.CODE_PATTERN,
@@ -153,7 +201,7 @@ class ConceptExtractor:
                 ))
         
         # Extract numbered definitions (e.g., "1. **Term** - definition")
-        for match in self.NUMBERED_LIST_PATTERN.finditer(text):
+        for match in self.NUMBERED_LIST_PATTERN.finditer(text) if has_bold else ():
             term = match.group(1)
             definition = match.group(2).strip()
             concepts.append(Concept(
@@ -172,7 +220,7 @@ class ConceptExtractor:
             ))
         
         # Extract bullet definitions
-        for match in self.BULLET_DEFINITION_PATTERN.finditer(text):
+        for match in self.BULLET_DEFINITION_PATTERN.finditer(text) if has_bold else ():
             term = match.group(1)
             definition = match.group(2).strip()
             concepts.append(Concept(
@@ -183,21 +231,24 @@ class ConceptExtractor:
                 importance=2
             ))
         
-        # Extract technical terms from the text
-        for term in self.technical_terms:
-            if term.lower() in text.lower():
-                # Find the actual occurrence to get context
-                pattern = re.compile(re.escape(term), re.IGNORECASE)
-                for match in pattern.finditer(text):
-                    context = self._get_sentence_context(text, match.start())
-                    concepts.append(Concept(
-                        text=match.group(),
-                        concept_type=ConceptType.TERM,
-                        context=context,
-                        source_question=source_question,
-                        importance=2
-                    ))
-                    break  # Only first occurrence
+        # Extract technical terms from the text (first occurrence of each).
+        # Lowercasing the text once lets a C-level substring test rule out
+        # absent terms; only terms that occur pay for a regex search.
+        text_lower = text.lower()
+        for term, term_lower, pattern in self._term_matchers:
+            if term_lower not in text_lower:
+                continue
+            match = pattern.search(text)
+            if match is None:
+                continue
+            context = self._get_sentence_context(text, match.start(), sentences)
+            concepts.append(Concept(
+                text=match.group(),
+                concept_type=ConceptType.TERM,
+                context=context,
+                source_question=source_question,
+                importance=2
+            ))
         
         return concepts
     
@@ -205,9 +256,14 @@ class ConceptExtractor:
         """Extract concepts from code blocks."""
         concepts = []
         
+        # Nothing shorter than 7 characters can yield a concept: a class
+        # match needs at least "class A", and a function match such as
+        # "let x" is only kept when its name has 3+ characters ("let abc")
+        if len(code) < 7:
+            return concepts
+        
         # Extract function/method names
-        func_pattern = re.compile(r"(?:def|function|const|let|var)\s+(\w+)")
-        for match in func_pattern.finditer(code):
+        for match in self.FUNCTION_NAME_PATTERN.finditer(code):
             name = match.group(1)
             if len(name) > 2 and not name.startswith("_"):
                 concepts.append(Concept(
@@ -219,8 +275,7 @@ class ConceptExtractor:
                 ))
         
         # Extract class names
-        class_pattern = re.compile(r"class\s+(\w+)")
-        for match in class_pattern.finditer(code):
+        for match in self.CLASS_NAME_PATTERN.finditer(code):
             name = match.group(1)
             concepts.append(Concept(
                 text=name,
@@ -232,14 +287,35 @@ class ConceptExtractor:
         
         return concepts
     
-    def _get_sentence_context(self, text: str, position: int) -> str:
+    def _sentence_spans(self, text: str) -> Tuple[List[int], List[Tuple[int, str]]]:
+        """Split text into sentence start offsets and (end, sentence) pairs."""
+        starts = []
+        spans = []
+        for match in self.SENTENCE_PATTERN.finditer(text):
+            starts.append(match.start())
+            spans.append((match.end(), match.group()))
+        return starts, spans
+    
+    def _get_sentence_context(
+        self,
+        text: str,
+        position: int,
+        sentences: Optional[Tuple[List[int], List[Tuple[int, str]]]] = None
+    ) -> str:
         """Get the sentence containing the given position."""
-        # Find sentence boundaries
-        sentences = list(self.SENTENCE_PATTERN.finditer(text))
+        # Find sentence boundaries; callers looking up many positions in the
+        # same text pass in the spans from _sentence_spans
+        if sentences is None:
+            sentences = self._sentence_spans(text)
+        starts, spans = sentences
         
-        for match in sentences:
-            if match.start() <= position < match.end():
-                return match.group().strip()
+        # Sentences don't overlap, so only the last one starting at or
+        # before position can contain it
+        index = bisect.bisect_right(starts, position) - 1
+        if index >= 0:
+            end, sentence = spans[index]
+            if position < end:
+                return sentence.strip()
         
         # Fallback: return surrounding text
         start = max(0, position - 100)
@@ -274,7 +350,7 @@ class ConceptExtractor:
     def _generate_hint(self, concept: Concept) -> Optional[str]:
         """Generate a hint for a cloze deletion."""
         if concept.concept_type == ConceptType.TERM:
-            return f"({len(concept.text)} letters)"
+            return _letter_count_hint(len(concept.text))
         elif concept.concept_type == ConceptType.CODE_PATTERN:
             return "(code)"
         elif concept.concept_type == ConceptType.DEFINITION:
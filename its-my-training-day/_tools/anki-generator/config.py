@@ -2,10 +2,17 @@
 Configuration settings for the Anki card generator.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 
 
+# Keyword arguments for @dataclass on the hot-path record types (AnkiCard,
+# ClozeCandidate): slotted dataclasses (3.10+) drop the per-instance __dict__,
+# and thousands of these are created per guide
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 @dataclass
 class GeneratorConfig:
     """Configuration for Anki card generation."""
@@ -36,6 +43,10 @@ class GeneratorConfig:
     
     # Deck ID base (will be modified per track)
     deck_id_base: int = 2059400110
+    
+    # zlib level (0-9) for the .apkg archive; None stores entries
+    # uncompressed, which is the fastest to write
+    compression_level: Optional[int] = None
 
 
 # Default configuration instance
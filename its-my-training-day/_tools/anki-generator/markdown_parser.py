@@ -6,7 +6,7 @@ Extracts metadata, questions, answers, and key concepts from study guide markdow
 
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
 
@@ -51,22 +51,57 @@ class MarkdownParser:
     # Regex patterns for parsing
     METADATA_PATTERN = re.compile(r"^\s*-\s*\*\*(.+?)\*\*:\s*(.+)$", re.MULTILINE)
     QUESTION_HEADER_PATTERN = re.compile(r"^###\s*Q(\d+):\s*(.+)$", re.MULTILINE)
+    # Linear despite the lazy DOTALL body: a fence only fails to match when
+    # no closing ``` follows it, and then no later fence can start either.
+    # Deliberately not anchored to line starts so indented fences still count.
     CODE_BLOCK_PATTERN = re.compile(r"```[\w]*\n(.*?)```", re.DOTALL)
     KEY_CONCEPTS_PATTERN = re.compile(r"\*\*Key Concepts:\*\*\s*((?:\n\s*-\s*.+)+)", re.MULTILINE)
     FOLLOW_UP_PATTERN = re.compile(r"\*\*Follow-up Questions:\*\*\s*((?:\n\s*\d+\.\s*.+)+)", re.MULTILINE)
     LIST_ITEM_PATTERN = re.compile(r"^\s*[-\d.]+\s*(.+)$", re.MULTILINE)
     
+    # Metadata field name -> (StudyGuideMetadata attribute, value converter)
+    _META_KEYS = {
+        "track": ("track", str),
+        "subdomain": ("subdomain", str),
+        "difficulty": ("difficulty", str.lower),
+        "target roles": ("target_roles", lambda v: [r.strip() for r in v.split(",")]),
+        "source jd": ("source_jd", lambda v: v if v.lower() != "n/a" else None),
+        "estimated time": ("estimated_time", str),
+        "created": ("created", str),
+        "last modified": ("last_modified", str),
+    }
+    
+    # Section and field patterns used by the _extract_* helpers. Each
+    # section is a header pattern plus the marker that ends its body (or
+    # the end of the content); see _find_section.
+    TITLE_RE = re.compile(r"^#\s+(?:Study Guide:\s*)?(.+)$", re.MULTILINE)
+    METADATA_HEADER_RE = re.compile(r"##\s*Metadata\s*\n", re.IGNORECASE)
+    METADATA_END_RE = re.compile(r"\n##")
+    OVERVIEW_HEADER_RE = re.compile(r"##\s*Overview\s*\n", re.IGNORECASE)
+    OVERVIEW_END_RE = re.compile(r"\n---|\n##")
+    QUESTIONS_HEADER_RE = re.compile(r"##\s*Questions\s*\n", re.IGNORECASE)
+    QUESTIONS_END_RE = re.compile(r"\n##\s*Summary|\n##\s*Practice", re.IGNORECASE)
+    QUESTION_HEADER_MATCH_RE = re.compile(r"###\s*Q(\d+):")
+    ANSWER_START_RE = re.compile(r"\*\*Answer:\*\*\s*", re.IGNORECASE)
+    ANSWER_END_RE = re.compile(r"\*\*Key Concepts:\*\*|\*\*Follow-up|\n---", re.IGNORECASE)
+    SUMMARY_HEADER_RE = re.compile(r"##\s*Summary\s*\n", re.IGNORECASE)
+    SUMMARY_END_RE = re.compile(r"\n##\s*Practice", re.IGNORECASE)
+    FOLLOWUP_ITEM_RE = re.compile(r"^\s*\d+\.\s*(.+)$", re.MULTILINE)
+    BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+    
     def __init__(self):
         pass
     
     def parse_file(self, file_path: str) -> ParsedStudyGuide:
         """Parse a study guide markdown file."""
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Study guide not found: {file_path}")
+        # Open directly rather than checking exists() first: one stat fewer
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Study guide not found: {file_path}") from None
         
-        content = path.read_text(encoding="utf-8")
-        return self.parse_content(content, str(path))
+        return self.parse_content(content, str(Path(file_path)))
     
     def parse_content(self, content: str, source_file: str = "") -> ParsedStudyGuide:
         """Parse study guide content from a string."""
@@ -94,9 +129,24 @@ class MarkdownParser:
             source_file=source_file
         )
     
+    def _find_section(self, content: str, header_re, end_re) -> Optional[Tuple[int, int]]:
+        """
+        Return the (start, end) span of the body under the first section
+        header, or None if there is no such header.
+        
+        The body runs to the first end marker after the header. Searching
+        for the marker finds the same boundary as a lazy DOTALL body with a
+        lookahead, without retrying the lookahead at every character.
+        """
+        header = header_re.search(content)
+        if not header:
+            return None
+        end = end_re.search(content, header.end())
+        return header.end(), end.start() if end else len(content)
+    
     def _extract_title(self, content: str) -> str:
         """Extract the title from the first H1 header."""
-        match = re.search(r"^#\s+(?:Study Guide:\s*)?(.+)$", content, re.MULTILINE)
+        match = self.TITLE_RE.search(content)
         return match.group(1).strip() if match else ""
     
     def _extract_metadata(self, content: str) -> StudyGuideMetadata:
@@ -104,93 +154,65 @@ class MarkdownParser:
         metadata = StudyGuideMetadata()
         
         # Find metadata section
-        metadata_section = re.search(
-            r"##\s*Metadata\s*\n(.*?)(?=\n##|\Z)",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        metadata_section = self._find_section(content, self.METADATA_HEADER_RE, self.METADATA_END_RE)
         
         if not metadata_section:
             return metadata
         
-        section_text = metadata_section.group(1)
+        start, end = metadata_section
+        section_text = content[start:end]
         
         # Parse each metadata field
         for match in self.METADATA_PATTERN.finditer(section_text):
             key = match.group(1).strip().lower()
             value = match.group(2).strip()
             
-            if key == "track":
-                metadata.track = value
-            elif key == "subdomain":
-                metadata.subdomain = value
-            elif key == "difficulty":
-                metadata.difficulty = value.lower()
-            elif key == "target roles":
-                metadata.target_roles = [r.strip() for r in value.split(",")]
-            elif key == "source jd":
-                metadata.source_jd = value if value.lower() != "n/a" else None
-            elif key == "estimated time":
-                metadata.estimated_time = value
-            elif key == "created":
-                metadata.created = value
-            elif key == "last modified":
-                metadata.last_modified = value
+            handler = self._META_KEYS.get(key)
+            if handler:
+                attr, convert = handler
+                setattr(metadata, attr, convert(value))
         
         return metadata
 
     def _extract_overview(self, content: str) -> str:
         """Extract the overview section."""
-        match = re.search(
-            r"##\s*Overview\s*\n(.*?)(?=\n---|\n##|\Z)",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
-        return match.group(1).strip() if match else ""
+        section = self._find_section(content, self.OVERVIEW_HEADER_RE, self.OVERVIEW_END_RE)
+        return content[section[0]:section[1]].strip() if section else ""
     
     def _extract_qa_pairs(self, content: str) -> List[QAPair]:
         """Extract all question-answer pairs from the content."""
         qa_pairs = []
         
         # Find the Questions section
-        questions_section = re.search(
-            r"##\s*Questions\s*\n(.*?)(?=\n##\s*Summary|\n##\s*Practice|\Z)",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        questions_section = self._find_section(content, self.QUESTIONS_HEADER_RE, self.QUESTIONS_END_RE)
         
         if not questions_section:
             return qa_pairs
         
-        section_text = questions_section.group(1)
+        # Scan the section in place via pos/endpos rather than slicing it
+        # out; it is most of the document, so the copy would nearly double
+        # peak memory on large guides
+        section_start, section_end = questions_section
         
-        # Split by question headers
-        question_splits = re.split(r"(###\s*Q\d+:)", section_text)
+        # Each header's body runs up to the next header (or the section end);
+        # the header match already carries the question number
+        headers = list(self.QUESTION_HEADER_MATCH_RE.finditer(content, section_start, section_end))
         
-        # Process pairs (header, content)
-        i = 1
-        while i < len(question_splits):
-            if not question_splits[i].startswith("###"):
-                i += 1
-                continue
-            
-            header = question_splits[i]
-            content_part = question_splits[i + 1] if i + 1 < len(question_splits) else ""
-            
-            # Extract question number and text
-            q_match = re.match(r"###\s*Q(\d+):", header)
-            if not q_match:
-                i += 2
-                continue
-            
+        for idx, q_match in enumerate(headers):
             q_num = int(q_match.group(1))
+            body_end = headers[idx + 1].start() if idx + 1 < len(headers) else section_end
+            content_part = content[q_match.end():body_end]
             
-            # Get question text (first line after header)
-            lines = content_part.strip().split("\n")
-            question_text = lines[0].strip() if lines else ""
-            
-            # Get the rest of the content
-            rest_content = "\n".join(lines[1:]) if len(lines) > 1 else ""
+            # Get question text (first line after header) and the rest of
+            # the content, splitting at the first newline only
+            content_part = content_part.strip()
+            newline = content_part.find("\n")
+            if newline < 0:
+                question_text = content_part
+                rest_content = ""
+            else:
+                question_text = content_part[:newline].strip()
+                rest_content = content_part[newline + 1:]
             
             # Extract answer
             answer = self._extract_answer(rest_content)
@@ -212,20 +234,20 @@ class MarkdownParser:
                 follow_up_questions=follow_ups,
                 code_blocks=code_blocks
             ))
-            
-            i += 2
         
         return qa_pairs
     
     def _extract_answer(self, content: str) -> str:
         """Extract the answer section from Q&A content."""
-        # Find content between **Answer:** and **Key Concepts:** or **Follow-up**
-        match = re.search(
-            r"\*\*Answer:\*\*\s*(.*?)(?=\*\*Key Concepts:\*\*|\*\*Follow-up|\n---|\Z)",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
-        return match.group(1).strip() if match else ""
+        # Find content between **Answer:** and **Key Concepts:** or **Follow-up**.
+        # Searching for the end marker from the start marker finds the same
+        # boundary as a lazy DOTALL body with a lookahead, without retrying
+        # the lookahead at every character.
+        start = self.ANSWER_START_RE.search(content)
+        if not start:
+            return ""
+        end = self.ANSWER_END_RE.search(content, start.end())
+        return content[start.end():end.start() if end else len(content)].strip()
     
     def _extract_key_concepts(self, content: str) -> List[str]:
         """Extract key concepts from Q&A content."""
@@ -237,8 +259,11 @@ class MarkdownParser:
         concepts = []
         for item_match in self.LIST_ITEM_PATTERN.finditer(concepts_text):
             concept = item_match.group(1).strip()
-            # Remove bold markers
-            concept = re.sub(r"\*\*(.+?)\*\*", r"\1", concept)
+            # Remove bold markers. A bare replace("**", "") would also eat
+            # unpaired markers, so keep the regex but skip it when there are
+            # no markers at all.
+            if "**" in concept:
+                concept = self.BOLD_RE.sub(r"\1", concept)
             if concept:
                 concepts.append(concept)
         
@@ -252,7 +277,7 @@ class MarkdownParser:
         
         follow_ups_text = match.group(1)
         follow_ups = []
-        for item_match in re.finditer(r"^\s*\d+\.\s*(.+)$", follow_ups_text, re.MULTILINE):
+        for item_match in self.FOLLOWUP_ITEM_RE.finditer(follow_ups_text):
             follow_up = item_match.group(1).strip()
             if follow_up:
                 follow_ups.append(follow_up)
@@ -270,9 +295,5 @@ class MarkdownParser:
     
     def _extract_summary(self, content: str) -> str:
         """Extract the summary section."""
-        match = re.search(
-            r"##\s*Summary\s*\n(.*?)(?=\n##\s*Practice|\Z)",
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
-        return match.group(1).strip() if match else ""
+        section = self._find_section(content, self.SUMMARY_HEADER_RE, self.SUMMARY_END_RE)
+        return content[section[0]:section[1]].strip() if section else ""
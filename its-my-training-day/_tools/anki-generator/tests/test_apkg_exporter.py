@@ -10,6 +10,8 @@ Validates: Requirements 11.3, 11.5
 import sys
 import os
 import tempfile
+import uuid
+import zipfile
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -39,49 +41,57 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-# Strategies for generating test data
+# Strategies for generating test data. Built once at import: Hypothesis
+# strategy objects are relatively expensive to construct per draw.
+# Letter-only and letter/digit text can't be all whitespace, so only the
+# alphabets that include separators keep the strip filter.
+_CARD_TYPE = st.sampled_from([CardType.CLOZE, CardType.BASIC])
+_LETTER_TEXT = st.text(
+    alphabet=st.characters(whitelist_categories=('L',)),
+    min_size=3, max_size=15
+)
+_PREFIX_TEXT = st.text(
+    alphabet=st.characters(whitelist_categories=('L', 'Z')),
+    min_size=5, max_size=30
+).filter(str.strip)
+_FRONT_TEXT = st.text(
+    alphabet=st.characters(whitelist_categories=('L', 'Z', 'P')),
+    min_size=10, max_size=100
+).filter(str.strip)
+_BACK_TEXT = st.text(
+    alphabet=st.characters(whitelist_categories=('L', 'Z', 'P')),
+    min_size=10, max_size=200
+).filter(str.strip)
+_TRACK_KEYS = tuple(TRACK_DECK_IDS.keys())
+_TRACK_STRAT = st.sampled_from(_TRACK_KEYS)
+_ID_TEXT = st.text(
+    alphabet=st.characters(whitelist_categories=('L', 'N')),
+    min_size=8, max_size=16
+)
+
+
 @st.composite
 def valid_anki_card(draw):
     """Generate a valid AnkiCard."""
-    card_type = draw(st.sampled_from([CardType.CLOZE, CardType.BASIC]))
+    card_type = draw(_CARD_TYPE)
     
     if card_type == CardType.CLOZE:
         # Generate valid cloze front
-        term = draw(st.text(
-            alphabet=st.characters(whitelist_categories=('L',)),
-            min_size=3, max_size=15
-        ).filter(lambda x: x.strip()))
-        
-        prefix = draw(st.text(
-            alphabet=st.characters(whitelist_categories=('L', 'Z')),
-            min_size=5, max_size=30
-        ).filter(lambda x: x.strip()))
+        term = draw(_LETTER_TEXT)
+        prefix = draw(_PREFIX_TEXT)
         
         front = f"{prefix} {{{{c1::{term}}}}}"
         back = term
     else:
-        front = draw(st.text(
-            alphabet=st.characters(whitelist_categories=('L', 'Z', 'P')),
-            min_size=10, max_size=100
-        ).filter(lambda x: x.strip()))
-        
-        back = draw(st.text(
-            alphabet=st.characters(whitelist_categories=('L', 'Z', 'P')),
-            min_size=10, max_size=200
-        ).filter(lambda x: x.strip()))
+        front = draw(_FRONT_TEXT)
+        back = draw(_BACK_TEXT)
     
-    track = draw(st.sampled_from(list(TRACK_DECK_IDS.keys())))
-    subdomain = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L',)),
-        min_size=3, max_size=15
-    ).filter(lambda x: x.strip()))
+    track = draw(_TRACK_STRAT)
+    subdomain = draw(_LETTER_TEXT)
     
     tags = [track, subdomain]
     
-    card_id = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N')),
-        min_size=8, max_size=16
-    ).filter(lambda x: x.strip()))
+    card_id = draw(_ID_TEXT)
     
     return AnkiCard(
         id=card_id,
@@ -106,6 +116,29 @@ def valid_card_list(draw, min_size=1, max_size=10):
     return cards
 
 
+@pytest.fixture(scope="class")
+def apkg_dir(tmp_path_factory):
+    """One output directory shared by every example of a property test."""
+    return tmp_path_factory.mktemp("apkg")
+
+
+@pytest.fixture(scope="class")
+def exporter():
+    """Exporters hold no per-export state, so one serves every example."""
+    return APKGExporter()
+
+
+@pytest.fixture(scope="class")
+def reader():
+    """Shared APKGReader, likewise stateless."""
+    return APKGReader()
+
+
+def _unique_apkg_path(directory) -> str:
+    """A fresh .apkg path inside directory, one per Hypothesis example."""
+    return os.path.join(directory, f"deck_{uuid.uuid4().hex}.apkg")
+
+
 class TestAPKGExporterProperties:
     """Property-based tests for APKGExporter.
     
@@ -117,46 +150,38 @@ class TestAPKGExporterProperties:
     
     @given(cards=valid_card_list(min_size=1, max_size=5))
     @settings(max_examples=100)
-    def test_apkg_export_round_trip_property(self, cards):
+    def test_apkg_export_round_trip_property(self, exporter, reader, apkg_dir, cards):
         """
         Property 2: APKG Export Round-Trip
         For any generated Anki card set, exporting to .apkg and re-importing
         SHALL preserve all card content, tags, and metadata.
         Validates: Requirements 11.3
         """
-        exporter = APKGExporter()
-        reader = APKGReader()
+        output_path = _unique_apkg_path(apkg_dir)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = os.path.join(temp_dir, "test_deck.apkg")
-            
-            # Export cards
-            result = exporter.export(cards, output_path, track="python-backend")
-            
-            assert result.success, f"Export should succeed: {result.error_message}"
-            assert os.path.exists(output_path), "APKG file should be created"
-            
-            # Read back the exported file
-            read_result = reader.read_apkg(output_path)
-            
-            # Verify card count matches
-            assert read_result["card_count"] == len(cards), \
-                f"Card count should match: expected {len(cards)}, got {read_result['card_count']}"
-            
-            # Verify tags are preserved
-            original_tags = set()
-            for card in cards:
-                original_tags.update(card.tags)
-            
-            read_tags = set(read_result["tags"])
-            
-            # All original tags should be in read tags
-            for tag in original_tags:
-                assert tag in read_tags, f"Tag '{tag}' should be preserved"
+        # Export cards
+        result = exporter.export(cards, output_path, track="python-backend")
+        
+        assert result.success, f"Export should succeed: {result.error_message}"
+        assert os.path.exists(output_path), "APKG file should be created"
+        
+        # Read back the exported file
+        read_result = reader.read_apkg(output_path)
+        
+        # Verify card count matches
+        assert read_result["card_count"] == len(cards), \
+            f"Card count should match: expected {len(cards)}, got {read_result['card_count']}"
+        
+        # Verify tags are preserved: all original tags should be in read tags
+        original_tags = {tag for card in cards for tag in card.tags}
+        read_tags = set(read_result["tags"])
+        
+        assert original_tags.issubset(read_tags), \
+            f"Tags should be preserved, missing: {original_tags - read_tags}"
     
     @given(cards=valid_card_list(min_size=1, max_size=5))
     @settings(max_examples=100, deadline=None)
-    def test_tag_consistency_property(self, cards):
+    def test_tag_consistency_property(self, exporter, reader, apkg_dir, cards):
         """
         Property 4: Tag Consistency
         For any generated Anki card, the tags SHALL include the correct
@@ -171,36 +196,26 @@ class TestAPKGExporterProperties:
         for card in cards:
             card.tags = [track, subdomain, "test-tag"]
         
-        exporter = APKGExporter()
-        
         # Verify tags match metadata
         assert exporter.verify_tags_match_metadata(cards, track, subdomain), \
             "All cards should have tags matching the expected track and subdomain"
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = os.path.join(temp_dir, "test_deck.apkg")
-            
-            # Export and verify
-            result = exporter.export(cards, output_path, track=track)
-            assert result.success, "Export should succeed"
-            
-            # Read back and verify tags
-            reader = APKGReader()
-            read_result = reader.read_apkg(output_path)
-            
-            # Track should be in tags
-            assert track in read_result["tags"], \
-                f"Track '{track}' should be in exported tags"
+        output_path = _unique_apkg_path(apkg_dir)
+        
+        # Export and verify
+        result = exporter.export(cards, output_path, track=track)
+        assert result.success, "Export should succeed"
+        
+        # Read back and verify tags
+        read_result = reader.read_apkg(output_path)
+        
+        # Track should be in tags
+        assert track in read_result["tags"], \
+            f"Track '{track}' should be in exported tags"
     
-    @given(
-        track=st.sampled_from(list(TRACK_DECK_IDS.keys())),
-        subdomain=st.text(
-            alphabet=st.characters(whitelist_categories=('L',)),
-            min_size=3, max_size=15
-        ).filter(lambda x: x.strip())
-    )
+    @given(track=_TRACK_STRAT, subdomain=_LETTER_TEXT)
     @settings(max_examples=100)
-    def test_tags_include_track_and_subdomain(self, track, subdomain):
+    def test_tags_include_track_and_subdomain(self, exporter, track, subdomain):
         """
         Property 4: Tag Consistency (comprehensive)
         Tags must include both track and subdomain.
@@ -217,8 +232,6 @@ class TestAPKGExporterProperties:
             )
         ]
         
-        exporter = APKGExporter()
-        
         # Verify tag consistency
         assert exporter.verify_tags_match_metadata(cards, track, subdomain)
         
@@ -321,3 +334,47 @@ class TestAPKGExporterUnit:
         assert not exporter.verify_tags_match_metadata(
             cards, "react-nodejs-fullstack"
         )
+    
+    def test_models_shared_across_exporters(self):
+        """Test that exporters reuse one cloze and one basic model."""
+        first = APKGExporter()
+        second = APKGExporter(GeneratorConfig(deck_name_prefix="Other"))
+        
+        assert first._cloze_model is second._cloze_model
+        assert first._basic_model is second._basic_model
+    
+    @pytest.mark.parametrize("level, compression", [
+        (None, zipfile.ZIP_STORED),
+        (1, zipfile.ZIP_DEFLATED),
+    ])
+    def test_compression_level_round_trip(self, tmp_path, level, compression):
+        """Test that each compression level writes a readable archive."""
+        exporter = APKGExporter(GeneratorConfig(compression_level=level))
+        
+        cards = [
+            AnkiCard(
+                id=f"test{i}",
+                front=f"Card {i} uses {{{{c1::term{i}}}}}",
+                back=f"term{i}",
+                tags=["python-backend", "fundamentals"],
+                source_file="test.md",
+                card_type=CardType.CLOZE
+            )
+            for i in range(3)
+        ]
+        
+        output_path = str(tmp_path / "test.apkg")
+        result = exporter.export(cards, output_path)
+        assert result.success, result.error_message
+        
+        with zipfile.ZipFile(output_path) as archive:
+            info = archive.getinfo("collection.anki2")
+            assert info.compress_type == compression
+            assert sorted(archive.namelist()) == ["collection.anki2", "media"]
+        
+        read_result = APKGReader().read_apkg(output_path)
+        assert read_result["card_count"] == 3
+        assert sorted(fields[0] for fields in read_result["fields"]) == [
+            card.front for card in cards
+        ]
+        assert {"python-backend", "fundamentals"} <= set(read_result["tags"])
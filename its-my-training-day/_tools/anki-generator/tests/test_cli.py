@@ -0,0 +1,132 @@
+"""
+Unit tests for the anki-generator command-line interface.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+# Check if genanki is available
+try:
+    import genanki
+    GENANKI_AVAILABLE = True
+except ImportError:
+    GENANKI_AVAILABLE = False
+
+from cli import create_parser, main, _today_stamp
+
+
+GUIDE_TEMPLATE = """# Study Guide: {title}
+
+## Metadata
+- **Track**: python-backend
+- **Subdomain**: fundamentals
+- **Difficulty**: intermediate
+- **Target Roles**: Backend Engineer
+- **Estimated Time**: 60 minutes
+
+## Questions
+
+### Q1: How does the event loop schedule coroutines?
+
+**Answer:**
+
+The **event loop** runs each `coroutine` until it awaits, then resumes
+another task. A **Future** holds a result that is not ready yet.
+
+**Key Concepts:**
+- Cooperative multitasking
+- Task scheduling
+
+---
+
+### Q2: When should you use a thread pool?
+
+**Answer:**
+
+Use a **thread pool** for blocking I/O such as `requests.get` so the
+**event loop** stays responsive.
+
+**Key Concepts:**
+- Blocking calls
+- Executor offloading
+
+---
+"""
+
+
+class TestGenerateAllCommand:
+    """Tests for the generate-all subcommand."""
+
+    @pytest.mark.skipif(not GENANKI_AVAILABLE, reason="genanki not installed")
+    def test_generate_all_counts_and_outputs(self, tmp_path, capsys):
+        """Two guides become two decks; a guide without Q&A is skipped."""
+        input_dir = tmp_path / "guides"
+        (input_dir / "python").mkdir(parents=True)
+        # Both guides share a title, so decks must be named by source path
+        (input_dir / "asyncio.md").write_text(
+            GUIDE_TEMPLATE.format(title="Concurrency"), encoding="utf-8"
+        )
+        (input_dir / "python" / "threads.md").write_text(
+            GUIDE_TEMPLATE.format(title="Concurrency"), encoding="utf-8"
+        )
+        (input_dir / "README.md").write_text(
+            "# Notes\n\nNothing to study here.\n", encoding="utf-8"
+        )
+        output_dir = tmp_path / "decks"
+
+        exit_code = main([
+            "generate-all",
+            "--input-dir", str(input_dir),
+            "--output", str(output_dir),
+            "--min-cards", "1",
+            "--workers", "2",
+        ])
+
+        out = capsys.readouterr().out
+        assert exit_code == 0
+        assert "Decks: 2 created, 0 failed, 1 skipped" in out
+
+        stamp = _today_stamp()
+        assert sorted(p.name for p in output_dir.iterdir()) == [
+            f"asyncio-{stamp}.apkg",
+            f"python-threads-{stamp}.apkg",
+        ]
+
+    def test_generate_all_rejects_clashing_output_names(self, tmp_path, capsys):
+        """Guides that map to the same .apkg name fail before any export."""
+        input_dir = tmp_path / "guides"
+        (input_dir / "python").mkdir(parents=True)
+        (input_dir / "python-threads.md").write_text(
+            GUIDE_TEMPLATE.format(title="A"), encoding="utf-8"
+        )
+        (input_dir / "python" / "threads.md").write_text(
+            GUIDE_TEMPLATE.format(title="B"), encoding="utf-8"
+        )
+        output_dir = tmp_path / "decks"
+
+        exit_code = main([
+            "generate-all",
+            "--input-dir", str(input_dir),
+            "--output", str(output_dir),
+        ])
+
+        assert exit_code == 1
+        assert "share an output name" in capsys.readouterr().err
+        assert not output_dir.exists()
+
+    @pytest.mark.parametrize("workers", ["0", "-2", "many"])
+    def test_workers_must_be_positive(self, workers, capsys):
+        """--workers rejects values ProcessPoolExecutor cannot take."""
+        parser = create_parser()
+
+        with pytest.raises(SystemExit):
+            parser.parse_args([
+                "generate-all", "-i", "in", "-o", "out", "--workers", workers
+            ])
+
+        assert "must be a positive integer" in capsys.readouterr().err
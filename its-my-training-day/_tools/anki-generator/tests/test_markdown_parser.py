@@ -17,37 +17,39 @@ from hypothesis import given, strategies as st, settings, assume
 from markdown_parser import MarkdownParser, StudyGuideMetadata, QAPair, ParsedStudyGuide
 
 
-# Strategies for generating valid study guide components
-@st.composite
-def valid_track(draw):
-    """Generate a valid track name."""
-    return draw(st.sampled_from([
-        "react-nodejs-fullstack",
-        "python-backend", 
-        "system-design-architecture"
-    ]))
-
-
-@st.composite
-def valid_difficulty(draw):
-    """Generate a valid difficulty level."""
-    return draw(st.sampled_from(["beginner", "intermediate", "advanced"]))
+# Strategies for generating valid study guide components, built once at
+# import rather than on every draw
+_TRACK = st.sampled_from([
+    "react-nodejs-fullstack",
+    "python-backend", 
+    "system-design-architecture"
+])
+_DIFFICULTY = st.sampled_from(["beginner", "intermediate", "advanced"])
+
+_WORDS = st.characters(whitelist_categories=('L', 'N', 'Z'))
+_PROSE = st.characters(whitelist_categories=('L', 'N', 'Z', 'P'))
+
+_SUBDOMAIN_TEXT = st.text(
+    alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_'),
+    min_size=3, max_size=20
+).filter(lambda x: x[0].isalpha())  # never blank: no separators
+_ROLE_TEXT = st.text(alphabet=_WORDS, min_size=3, max_size=30).filter(lambda x: x.strip())
+_QUESTION_TEXT = st.text(
+    alphabet=_PROSE, min_size=10, max_size=200
+).filter(lambda x: x.strip() and '?' in x or x.endswith('?') == False)
+_ANSWER_TEXT = st.text(alphabet=_PROSE, min_size=50, max_size=500).filter(lambda x: x.strip())
+_CONCEPT_TEXT = st.text(alphabet=_WORDS, min_size=3, max_size=50).filter(lambda x: x.strip())
+_TITLE_TEXT = st.text(alphabet=_WORDS, min_size=5, max_size=50).filter(lambda x: x.strip())
+_OVERVIEW_TEXT = st.text(alphabet=_PROSE, min_size=20, max_size=200).filter(lambda x: x.strip())
 
 
 @st.composite
 def valid_metadata(draw):
     """Generate valid metadata fields."""
-    track = draw(valid_track())
-    subdomain = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='-_'),
-        min_size=3, max_size=20
-    ).filter(lambda x: x.strip() and x[0].isalpha()))
-    difficulty = draw(valid_difficulty())
-    roles = draw(st.lists(
-        st.text(alphabet=st.characters(whitelist_categories=('L', 'N', 'Z')), min_size=3, max_size=30)
-        .filter(lambda x: x.strip()),
-        min_size=1, max_size=3
-    ))
+    track = draw(_TRACK)
+    subdomain = draw(_SUBDOMAIN_TEXT)
+    difficulty = draw(_DIFFICULTY)
+    roles = draw(st.lists(_ROLE_TEXT, min_size=1, max_size=3))
     estimated_time = draw(st.integers(min_value=15, max_value=180))
     
     return {
@@ -62,10 +64,7 @@ def valid_metadata(draw):
 @st.composite
 def valid_question(draw, q_num: int = 1):
     """Generate a valid question text."""
-    question = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N', 'Z', 'P')),
-        min_size=10, max_size=200
-    ).filter(lambda x: x.strip() and '?' in x or x.endswith('?') == False))
+    question = draw(_QUESTION_TEXT)
     
     # Ensure it ends with a question mark
     if not question.strip().endswith('?'):
@@ -77,22 +76,13 @@ def valid_question(draw, q_num: int = 1):
 @st.composite
 def valid_answer(draw):
     """Generate a valid answer text."""
-    return draw(st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N', 'Z', 'P')),
-        min_size=50, max_size=500
-    ).filter(lambda x: x.strip()))
+    return draw(_ANSWER_TEXT)
 
 
 @st.composite
 def valid_key_concepts(draw):
     """Generate valid key concepts list."""
-    return draw(st.lists(
-        st.text(
-            alphabet=st.characters(whitelist_categories=('L', 'N', 'Z')),
-            min_size=3, max_size=50
-        ).filter(lambda x: x.strip()),
-        min_size=1, max_size=5
-    ))
+    return draw(st.lists(_CONCEPT_TEXT, min_size=1, max_size=5))
 
 
 @st.composite
@@ -177,9 +167,9 @@ class TestMarkdownParserProperties:
     """
     
     @given(
-        title=st.text(alphabet=st.characters(whitelist_categories=('L', 'N', 'Z')), min_size=5, max_size=50).filter(lambda x: x.strip()),
+        title=_TITLE_TEXT,
         metadata=valid_metadata(),
-        overview=st.text(alphabet=st.characters(whitelist_categories=('L', 'N', 'Z', 'P')), min_size=20, max_size=200).filter(lambda x: x.strip()),
+        overview=_OVERVIEW_TEXT,
     )
     @settings(max_examples=100)
     def test_metadata_extraction_preserves_all_fields(self, title, metadata, overview):
@@ -376,3 +366,22 @@ Both manage state, but they're optimized for different scenarios.
         assert result.metadata.track == ""
         assert len(result.qa_pairs) == 0
         assert result.overview == ""
+    
+    def test_code_blocks_indented_and_unterminated_fences(self):
+        """Indented fences are extracted; an unterminated fence is ignored."""
+        parser = MarkdownParser()
+        content = (
+            "1. Example:\n"
+            "   ```python\n"
+            "   def handler():\n"
+            "       pass\n"
+            "   ```\n"
+            "Trailing text with an unterminated fence:\n"
+            "```js\n"
+            "const x = 1;\n"
+        )
+        
+        code_blocks = parser._extract_code_blocks(content)
+        
+        assert len(code_blocks) == 1
+        assert code_blocks[0].startswith("def handler():")
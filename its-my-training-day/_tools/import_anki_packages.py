@@ -3,51 +3,142 @@ import json
 import os
 import sys
 import time
-from urllib import error, request
+from concurrent.futures import ThreadPoolExecutor
+from http import client
+from urllib import parse
+
+# orjson is optional: it encodes straight to bytes and decodes bytes without
+# a separate UTF-8 decode step
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
 
 
 DEFAULT_ANKI_CONNECT_URL = "http://127.0.0.1:8765"
 
+# Keep-alive connections per AnkiConnect URL: url -> [connection, path, used]
+_connections = {}
+
+
+def _get_connection(url):
+    entry = _connections.get(url)
+    if entry is None:
+        parts = parse.urlsplit(url)
+        conn_cls = client.HTTPSConnection if parts.scheme == "https" else client.HTTPConnection
+        entry = [conn_cls(parts.hostname, parts.port), parts.path or "/", False]
+        _connections[url] = entry
+    return entry
+
+
+def _drop_connection(url):
+    entry = _connections.pop(url, None)
+    if entry is not None:
+        entry[0].close()
+
+
+def _post(url, data):
+    # Reuse one socket across calls instead of a new connection per request.
+    # If a reused socket turns out to have been closed by the server, retry
+    # once on a fresh connection; a fresh connection failing is reported.
+    while True:
+        entry = _get_connection(url)
+        conn, path, reused = entry
+        try:
+            conn.request("POST", path, body=data, headers={"Content-Type": "application/json"})
+            with conn.getresponse() as resp:
+                body = resp.read()
+                status = resp.status
+        except (OSError, client.HTTPException) as exc:
+            _drop_connection(url)
+            if reused and isinstance(exc, (ConnectionError, client.RemoteDisconnected)):
+                continue
+            raise RuntimeError(f"AnkiConnect not reachable at {url}") from exc
+        entry[2] = True
+        if status >= 400:
+            raise RuntimeError(f"AnkiConnect at {url} returned HTTP {status}")
+        return body
+
 
 def call_anki_connect(action, params=None, url=DEFAULT_ANKI_CONNECT_URL):
     payload = {"action": action, "version": 6}
     if params:
         payload["params"] = params
-    data = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=data, headers={"Content-Type": "application/json"})
-    try:
-        with request.urlopen(req) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-    except error.URLError as exc:
-        raise RuntimeError(f"AnkiConnect not reachable at {url}") from exc
+    result = _loads(_post(url, _dumps(payload)))
     if result.get("error"):
         raise RuntimeError(result["error"])
     return result.get("result")
 
 
 def find_apkg_files(root_dir):
+    # Same traversal as os.walk (symlinked directories are not entered,
+    # unreadable ones are skipped) without building per-directory name
+    # lists; DirEntry.is_dir() is answered from the directory listing.
     apkg_files = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        for name in filenames:
-            if name.lower().endswith(".apkg"):
-                apkg_files.append(os.path.join(dirpath, name))
-    return sorted(apkg_files)
-
-
-def import_packages(apkg_files, delay_ms, url):
+    stack = [root_dir]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith(".apkg"):
+                    apkg_files.append(entry.path)
+    apkg_files.sort()
+    return apkg_files
+
+
+def import_batch(paths, url):
+    """Import several packages in one AnkiConnect 'multi' request.
+
+    Returns one error message (or None on success) per path, in order.
+    """
+    actions = [
+        {"action": "importPackage", "version": 6, "params": {"path": path}}
+        for path in paths
+    ]
+    results = call_anki_connect("multi", {"actions": actions}, url=url)
+    # Versioned sub-actions each come back as {"result": ..., "error": ...}
+    return [
+        item.get("error") if isinstance(item, dict) else None
+        for item in results
+    ]
+
+
+def import_packages(apkg_files, delay_ms, url, batch_size=10):
     if not apkg_files:
         print("No .apkg files found.")
         return 0
 
+    batch_size = max(1, batch_size)
     failures = 0
-    for path in apkg_files:
-        print(f"Importing: {path}")
+    for start in range(0, len(apkg_files), batch_size):
+        batch = apkg_files[start:start + batch_size]
+        for path in batch:
+            print(f"Importing: {path}")
         try:
-            call_anki_connect("importPackage", {"path": path}, url=url)
+            errors = import_batch(batch, url)
         except Exception as exc:  # noqa: BLE001 - keep simple CLI behavior
-            failures += 1
-            print(f"Failed: {path}\n  {exc}")
-        if delay_ms:
+            errors = [str(exc)] * len(batch)
+        for path, message in zip(batch, errors):
+            if message:
+                failures += 1
+                print(f"Failed: {path}\n  {message}")
+        if delay_ms and start + batch_size < len(apkg_files):
             time.sleep(delay_ms / 1000.0)
     return failures
 
@@ -71,7 +162,13 @@ def main():
         "--delay-ms",
         type=int,
         default=250,
-        help="Delay between imports to keep Anki responsive (default: 250ms).",
+        help="Delay between import batches to keep Anki responsive (default: 250ms).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10,
+        help="Packages imported per AnkiConnect request (default: 10).",
     )
     parser.add_argument(
         "--anki-url",
@@ -85,13 +182,16 @@ def main():
         return 1
 
     print("Make sure Anki is open and AnkiConnect is installed/enabled.")
-    try:
-        ensure_anki_connect(args.anki_url)
-    except RuntimeError as exc:
-        print(f"{exc}\nOpen Anki and enable AnkiConnect, then retry.")
-        return 1
-    apkg_files = find_apkg_files(args.folder)
-    failures = import_packages(apkg_files, args.delay_ms, args.anki_url)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Scan the folder while the connectivity check waits on AnkiConnect
+        discovery = pool.submit(find_apkg_files, args.folder)
+        try:
+            ensure_anki_connect(args.anki_url)
+        except RuntimeError as exc:
+            print(f"{exc}\nOpen Anki and enable AnkiConnect, then retry.")
+            return 1
+        apkg_files = discovery.result()
+    failures = import_packages(apkg_files, args.delay_ms, args.anki_url, args.batch_size)
 
     if failures:
         print(f"Done with {failures} failure(s).")
@@ -0,0 +1,231 @@
+"""
+Unit tests for the AnkiConnect package importer.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+import import_anki_packages as importer
+
+
+URL = "http://127.0.0.1:8765"
+
+
+class FakeResponse:
+    """Minimal stand-in for http.client.HTTPResponse."""
+
+    def __init__(self, body, status=200):
+        self.body = body
+        self.status = status
+
+    def read(self):
+        return self.body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    """HTTPConnection stand-in that fails or answers from a script."""
+
+    def __init__(self, error=None, body=b'{"result": 6, "error": null}'):
+        self.error = error
+        self.body = body
+        self.requests = []
+        self.closed = False
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests.append((method, path, body))
+        if self.error is not None:
+            raise self.error
+
+    def getresponse(self):
+        return FakeResponse(self.body)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def no_cached_connections():
+    """Each test starts and ends without pooled connections."""
+    importer._connections.clear()
+    yield
+    importer._connections.clear()
+
+
+@pytest.fixture
+def fresh_connections(monkeypatch):
+    """Queue of FakeConnections handed out for new HTTP connections."""
+    queue = []
+
+    def connect(host, port):
+        return queue.pop(0)
+
+    monkeypatch.setattr(importer.client, "HTTPConnection", connect)
+    return queue
+
+
+def stub_post(monkeypatch, responses):
+    """Replace _post with one that records payloads and replays responses."""
+    sent = []
+
+    def fake_post(url, data):
+        sent.append(json.loads(data))
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return json.dumps(response).encode("utf-8")
+
+    monkeypatch.setattr(importer, "_post", fake_post)
+    return sent
+
+
+class TestPost:
+    """Tests for the keep-alive connection handling in _post."""
+
+    def test_reuses_connection_between_calls(self, fresh_connections):
+        conn = FakeConnection()
+        fresh_connections.append(conn)
+
+        importer._post(URL, b"{}")
+        importer._post(URL, b"{}")
+
+        assert len(conn.requests) == 2
+        assert not conn.closed
+
+    def test_retries_once_when_reused_connection_was_dropped(self, fresh_connections):
+        stale = FakeConnection()
+        fresh = FakeConnection(body=b"ok")
+        fresh_connections.extend([stale, fresh])
+
+        importer._post(URL, b"{}")
+        stale.error = ConnectionResetError()
+
+        assert importer._post(URL, b"{}") == b"ok"
+        assert stale.closed
+        assert len(fresh.requests) == 1
+
+    def test_fresh_connection_failure_is_not_retried(self, fresh_connections):
+        refused = FakeConnection(error=ConnectionRefusedError())
+        fresh_connections.append(refused)
+
+        with pytest.raises(RuntimeError, match="not reachable"):
+            importer._post(URL, b"{}")
+
+        assert len(refused.requests) == 1
+        assert refused.closed
+        assert URL not in importer._connections
+
+    def test_http_error_status_raises(self, fresh_connections, monkeypatch):
+        conn = FakeConnection()
+        fresh_connections.append(conn)
+        monkeypatch.setattr(
+            conn, "getresponse", lambda: FakeResponse(b"", status=500)
+        )
+
+        with pytest.raises(RuntimeError, match="HTTP 500"):
+            importer._post(URL, b"{}")
+
+
+class TestImportBatch:
+    """Tests for batching imports through the AnkiConnect multi action."""
+
+    def test_maps_per_action_errors_back_to_paths(self, monkeypatch):
+        sent = stub_post(monkeypatch, [{
+            "result": [
+                {"result": True, "error": None},
+                {"result": None, "error": "collection.anki2 missing"},
+                True,
+            ],
+            "error": None,
+        }])
+
+        errors = importer.import_batch(["a.apkg", "b.apkg", "c.apkg"], URL)
+
+        assert errors == [None, "collection.anki2 missing", None]
+        assert sent[0]["action"] == "multi"
+        assert [
+            action["params"]["path"] for action in sent[0]["params"]["actions"]
+        ] == ["a.apkg", "b.apkg", "c.apkg"]
+
+    def test_top_level_error_raises(self, monkeypatch):
+        stub_post(monkeypatch, [{"result": None, "error": "unsupported action"}])
+
+        with pytest.raises(RuntimeError, match="unsupported action"):
+            importer.import_batch(["a.apkg"], URL)
+
+
+class TestImportPackages:
+    """Tests for import_packages failure accounting."""
+
+    def test_counts_failures_across_batches(self, monkeypatch, capsys):
+        sent = stub_post(monkeypatch, [
+            {"result": [{"result": True, "error": None},
+                        {"result": None, "error": "bad deck"}],
+             "error": None},
+            {"result": [{"result": True, "error": None}], "error": None},
+        ])
+
+        failures = importer.import_packages(
+            ["a.apkg", "b.apkg", "c.apkg"], 0, URL, batch_size=2
+        )
+
+        assert failures == 1
+        assert len(sent) == 2
+        assert "Failed: b.apkg\n  bad deck" in capsys.readouterr().out
+
+    def test_failed_request_fails_whole_batch(self, monkeypatch, capsys):
+        stub_post(monkeypatch, [RuntimeError("AnkiConnect not reachable")])
+
+        failures = importer.import_packages(["a.apkg", "b.apkg"], 0, URL)
+
+        assert failures == 2
+        assert capsys.readouterr().out.count("AnkiConnect not reachable") == 2
+
+    def test_no_files(self, capsys):
+        assert importer.import_packages([], 0, URL) == 0
+        assert "No .apkg files found." in capsys.readouterr().out
+
+
+class TestFindApkgFiles:
+    """Tests for the recursive .apkg scan."""
+
+    def test_finds_nested_packages_sorted(self, tmp_path):
+        (tmp_path / "b" / "deep").mkdir(parents=True)
+        (tmp_path / "a").mkdir()
+        for name in ("b/deep/two.apkg", "a/ONE.APKG", "root.apkg",
+                     "a/notes.md", "b/deep/archive.apkg.bak"):
+            (tmp_path / name).write_bytes(b"")
+
+        assert importer.find_apkg_files(str(tmp_path)) == sorted([
+            os.path.join(str(tmp_path), "a", "ONE.APKG"),
+            os.path.join(str(tmp_path), "b", "deep", "two.apkg"),
+            os.path.join(str(tmp_path), "root.apkg"),
+        ])
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path):
+        target = tmp_path / "elsewhere"
+        target.mkdir()
+        (target / "linked.apkg").write_bytes(b"")
+        root = tmp_path / "root"
+        root.mkdir()
+        try:
+            os.symlink(target, root / "link", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported here")
+
+        assert importer.find_apkg_files(str(root)) == []
+
+    def test_missing_root_yields_nothing(self, tmp_path):
+        assert importer.find_apkg_files(str(tmp_path / "missing")) == []
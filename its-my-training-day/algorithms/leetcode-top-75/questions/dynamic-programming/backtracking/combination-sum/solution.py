@@ -1,29 +1,26 @@
-import os
-import sys
 from typing import List, Dict, Optional, Tuple
 
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
-if ROOT_DIR not in sys.path:
-    sys.path.append(ROOT_DIR)
-
-from shared.python.ds import ArrayList, ListNode, Stack, Queue, TreeNode, MinHeap, MaxHeap
-
 def combination_sum(candidates: List[int], target: int) -> List[List[int]]:
-    result = ArrayList()
-    path = ArrayList()
+    # Sorted ascending so the loop can stop at the first candidate that
+    # overshoots the remaining target.
+    candidates = sorted(candidates)
+    n = len(candidates)
+    result: List[List[int]] = []
+    path: List[int] = []
 
-    def backtrack(start: int, total: int) -> None:
-        if total == target:
-            result.add(path.to_list())
-            return
-        if total > target:
+    def backtrack(start: int, remaining: int) -> None:
+        if remaining == 0:
+            result.append(path.copy())
             return
         i = start
-        while i < len(candidates):
-            path.add(candidates[i])
-            backtrack(i, total + candidates[i])
-            path.remove_last()
+        while i < n:
+            cand = candidates[i]
+            if cand > remaining:
+                break
+            path.append(cand)
+            backtrack(i, remaining - cand)
+            path.pop()
             i += 1
 
-    backtrack(0, 0)
-    return result.to_list()
+    backtrack(0, target)
+    return result
@@ -1,17 +1,10 @@
-import os
-import sys
 from typing import List, Dict, Optional, Tuple
 
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
-if ROOT_DIR not in sys.path:
-    sys.path.append(ROOT_DIR)
-
-from shared.python.ds import ArrayList, ListNode, Stack, Queue, TreeNode, MinHeap, MaxHeap
-
 def graph_valid_tree(n: int, edges: List[List[int]]) -> bool:
     if len(edges) != n - 1:
         return False
-    parent = [i for i in range(n)]
+    parent = list(range(n))
+    rank = [0] * n
 
     def find(x: int) -> int:
         while parent[x] != x:
@@ -19,14 +12,14 @@ def graph_valid_tree(n: int, edges: List[List[int]]) -> bool:
             x = parent[x]
         return x
 
-    i = 0
-    while i < len(edges):
-        a = edges[i][0]
-        b = edges[i][1]
+    for a, b in edges:
         pa = find(a)
         pb = find(b)
         if pa == pb:
             return False
+        if rank[pa] < rank[pb]:
+            pa, pb = pb, pa
         parent[pb] = pa
-        i += 1
+        if rank[pa] == rank[pb]:
+            rank[pa] += 1
     return True
@@ -1,3 +1,5 @@
+from collections import deque
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 
 from shared.python.ds import ArrayList, ListNode, Stack, Queue, TreeNode, MinHeap, MaxHeap
@@ -34,15 +36,8 @@ def best_time_buy_sell_stock(prices: List[int]) -> int:
 
 
 def contains_duplicate(nums: List[int]) -> bool:
-    seen: Dict[int, bool] = {}
-    i = 0
-    while i < len(nums):
-        val = nums[i]
-        if val in seen:
-            return True
-        seen[val] = True
-        i += 1
-    return False
+    # Building the set runs entirely in C; any duplicate makes it smaller.
+    return len(set(nums)) < len(nums)
 
 
 def product_except_self(nums: List[int]) -> List[int]:
@@ -83,16 +78,19 @@ def maximum_product_subarray(nums: List[int]) -> int:
     max_val = nums[0]
     min_val = nums[0]
     best = nums[0]
-    i = 1
-    while i < len(nums):
-        val = nums[i]
+    # Skip the first element via the iterator rather than nums[1:], which
+    # would copy the whole list.
+    it = iter(nums)
+    next(it)
+    for val in it:
         if val < 0:
             max_val, min_val = min_val, max_val
-        max_val = max(val, max_val * val)
-        min_val = min(val, min_val * val)
+        hi = max_val * val
+        lo = min_val * val
+        max_val = val if val > hi else hi
+        min_val = val if val < lo else lo
         if max_val > best:
             best = max_val
-        i += 1
     return best
 
 
@@ -247,34 +245,46 @@ def reverse_bits(n: int) -> int:
     return result
 
 
+def _fib_pair(n: int) -> Tuple[int, int]:
+    # Fast doubling: (F(n), F(n + 1)) in O(log n) big-int multiplications.
+    if n == 0:
+        return 0, 1
+    a, b = _fib_pair(n >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    return (d, c + d) if n & 1 else (c, d)
+
+
+@lru_cache(maxsize=128)
 def climbing_stairs(n: int) -> int:
     if n <= 2:
         return n
-    prev2 = 1
-    prev1 = 2
-    i = 3
-    while i <= n:
-        current = prev1 + prev2
-        prev2 = prev1
-        prev1 = current
-        i += 1
-    return prev1
+    if n <= 64:
+        # Below ~64 steps (including the problem's n <= 45) a plain rolling
+        # loop beats the doubling recursion's call overhead.
+        prev2, prev1 = 1, 2
+        for _ in range(n - 2):
+            prev2, prev1 = prev1, prev1 + prev2
+        return prev1
+    # Ways to climb n stairs follow Fibonacci: climbing_stairs(n) == F(n + 1).
+    return _fib_pair(n + 1)[0]
 
 
 def coin_change(coins: List[int], amount: int) -> int:
     dp = [amount + 1] * (amount + 1)
     dp[0] = 0
-    i = 1
-    while i <= amount:
-        j = 0
-        while j < len(coins):
-            coin = coins[j]
-            if coin <= i:
-                cand = dp[i - coin] + 1
-                if cand < dp[i]:
-                    dp[i] = cand
-            j += 1
-        i += 1
+    # Duplicate denominations would only repeat an identical full pass.
+    for coin in set(coins):
+        if coin > amount:
+            continue
+        # Coin-outer order: dp[i - coin] may already include this coin,
+        # which is what makes the knapsack unbounded.
+        i = coin
+        while i <= amount:
+            cand = dp[i - coin] + 1
+            if cand < dp[i]:
+                dp[i] = cand
+            i += 1
     return -1 if dp[amount] == amount + 1 else dp[amount]
 
 
@@ -339,24 +349,29 @@ def word_break(s: str, word_dict: List[str]) -> bool:
 
 
 def combination_sum(candidates: List[int], target: int) -> List[List[int]]:
-    result = ArrayList()
-    path = ArrayList()
-
-    def backtrack(start: int, total: int) -> None:
-        if total == target:
-            result.add(path.to_list())
-            return
-        if total > target:
+    # Sorted ascending so the loop can stop at the first candidate that
+    # overshoots the remaining target.
+    candidates = sorted(candidates)
+    n = len(candidates)
+    result: List[List[int]] = []
+    path: List[int] = []
+
+    def backtrack(start: int, remaining: int) -> None:
+        if remaining == 0:
+            result.append(path.copy())
             return
         i = start
-        while i < len(candidates):
-            path.add(candidates[i])
-            backtrack(i, total + candidates[i])
-            path.remove_last()
+        while i < n:
+            cand = candidates[i]
+            if cand > remaining:
+                break
+            path.append(cand)
+            backtrack(i, remaining - cand)
+            path.pop()
             i += 1
 
-    backtrack(0, 0)
-    return result.to_list()
+    backtrack(0, target)
+    return result
 
 
 def house_robber(nums: List[int]) -> int:
@@ -494,48 +509,54 @@ def course_schedule(num_courses: int, prerequisites: List[List[int]]) -> bool:
     return visited == num_courses
 
 
+_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
 def pacific_atlantic(heights: List[List[int]]) -> List[List[int]]:
     if not heights or not heights[0]:
         return []
     rows = len(heights)
     cols = len(heights[0])
-    pac = [[False] * cols for _ in range(rows)]
-    atl = [[False] * cols for _ in range(rows)]
-
-    def dfs(r: int, c: int, visited: List[List[bool]]):
-        visited[r][c] = True
-        dr = [1, -1, 0, 0]
-        dc = [0, 0, 1, -1]
-        i = 0
-        while i < 4:
-            nr = r + dr[i]
-            nc = c + dc[i]
-            if 0 <= nr < rows and 0 <= nc < cols:
-                if not visited[nr][nc] and heights[nr][nc] >= heights[r][c]:
-                    dfs(nr, nc, visited)
-            i += 1
-
-    r = 0
-    while r < rows:
-        dfs(r, 0, pac)
-        dfs(r, cols - 1, atl)
-        r += 1
-    c = 0
-    while c < cols:
-        dfs(0, c, pac)
-        dfs(rows - 1, c, atl)
-        c += 1
-
-    result = ArrayList()
+    # Flat row-major visited flags, indexed r * cols + c.
+    pac = bytearray(rows * cols)
+    atl = bytearray(rows * cols)
+
+    def flood(sources: List[Tuple[int, int]], visited: bytearray) -> None:
+        # Multi-source BFS from every border cell of one ocean at once. Cells
+        # are marked when enqueued, so each is expanded at most once.
+        queue = deque()
+        for r, c in sources:
+            idx = r * cols + c
+            if not visited[idx]:
+                visited[idx] = 1
+                queue.append((r, c))
+        while queue:
+            r, c = queue.popleft()
+            h = heights[r][c]
+            for dr, dc in _DIRS:
+                nr = r + dr
+                nc = c + dc
+                if 0 <= nr < rows and 0 <= nc < cols:
+                    nidx = nr * cols + nc
+                    if not visited[nidx] and heights[nr][nc] >= h:
+                        visited[nidx] = 1
+                        queue.append((nr, nc))
+
+    flood([(r, 0) for r in range(rows)] + [(0, c) for c in range(cols)], pac)
+    flood([(r, cols - 1) for r in range(rows)] + [(rows - 1, c) for c in range(cols)], atl)
+
+    result: List[List[int]] = []
     r = 0
     while r < rows:
+        row_base = r * cols
         c = 0
         while c < cols:
-            if pac[r][c] and atl[r][c]:
-                result.add([r, c])
+            idx = row_base + c
+            if pac[idx] and atl[idx]:
+                result.append([r, c])
             c += 1
         r += 1
-    return result.to_list()
+    return result
 
 
 def number_of_islands(grid: List[List[str]]) -> int:
@@ -646,7 +667,8 @@ def alien_dictionary(words: List[str]) -> str:
 def graph_valid_tree(n: int, edges: List[List[int]]) -> bool:
     if len(edges) != n - 1:
         return False
-    parent = [i for i in range(n)]
+    parent = list(range(n))
+    rank = [0] * n
 
     def find(x: int) -> int:
         while parent[x] != x:
@@ -654,16 +676,16 @@ def graph_valid_tree(n: int, edges: List[List[int]]) -> bool:
             x = parent[x]
         return x
 
-    i = 0
-    while i < len(edges):
-        a = edges[i][0]
-        b = edges[i][1]
+    for a, b in edges:
         pa = find(a)
         pb = find(b)
         if pa == pb:
             return False
+        if rank[pa] < rank[pb]:
+            pa, pb = pb, pa
         parent[pb] = pa
-        i += 1
+        if rank[pa] == rank[pb]:
+            rank[pa] += 1
     return True
 
 
@@ -866,34 +888,27 @@ def reorder_list(head: Optional[ListNode]) -> None:
 def set_matrix_zeroes(matrix: List[List[int]]) -> None:
     rows = len(matrix)
     cols = len(matrix[0])
-    row_zero = False
-    col_zero = False
-    r = 0
-    while r < rows:
-        if matrix[r][0] == 0:
-            col_zero = True
-        r += 1
-    c = 0
-    while c < cols:
-        if matrix[0][c] == 0:
-            row_zero = True
-        c += 1
+    row_zero = 0 in matrix[0]
+    col_zero = any(row[0] == 0 for row in matrix)
     r = 1
     while r < rows:
-        c = 1
-        while c < cols:
-            if matrix[r][c] == 0:
-                matrix[r][0] = 0
+        row = matrix[r]
+        if 0 in row:
+            # Probe for zeros with list.index instead of comparing every cell.
+            start = 1
+            while True:
+                try:
+                    c = row.index(0, start)
+                except ValueError:
+                    break
+                row[0] = 0
                 matrix[0][c] = 0
-            c += 1
+                start = c + 1
         r += 1
     r = 1
     while r < rows:
         if matrix[r][0] == 0:
-            c = 1
-            while c < cols:
-                matrix[r][c] = 0
-                c += 1
+            matrix[r][1:] = [0] * (cols - 1)
         r += 1
     c = 1
     while c < cols:
@@ -1096,24 +1111,17 @@ def valid_anagram(s: str, t: str) -> bool:
 
 
 def group_anagrams(strs: List[str]) -> List[List[str]]:
-    groups: Dict[Tuple[int, ...], ArrayList] = {}
-    i = 0
-    while i < len(strs):
-        s = strs[i]
-        count = [0] * 26
-        j = 0
-        while j < len(s):
-            count[ord(s[j]) - 97] += 1
-            j += 1
-        key = tuple(count)
-        if key not in groups:
-            groups[key] = ArrayList()
-        groups[key].add(s)
-        i += 1
-    result = ArrayList()
-    for key in groups:
-        result.add(groups[key].to_list())
-    return result.to_list()
+    groups: Dict[object, List[str]] = {}
+    for s in strs:
+        # Anagrams have equal length, so the key kind may depend on it.
+        # Short strings: sorted bytes (C timsort). Longer ones: a letter
+        # histogram counted by str.count, which wins past ~50 chars.
+        if len(s) <= 48:
+            key = bytes(sorted(s.encode()))
+        else:
+            key = tuple(map(s.count, "abcdefghijklmnopqrstuvwxyz"))
+        groups.setdefault(key, []).append(s)
+    return list(groups.values())
 
 
 def valid_parentheses(s: str) -> bool:
@@ -1191,29 +1199,20 @@ def palindromic_substrings(s: str) -> int:
 
 
 def encode_strings(strs: List[str]) -> str:
-    parts = ArrayList()
-    i = 0
-    while i < len(strs):
-        s = strs[i]
-        parts.add(str(len(s)))
-        parts.add("#")
-        parts.add(s)
-        i += 1
-    return "".join(parts.to_list())
+    return "".join(f"{len(s)}#{s}" for s in strs)
 
 
 def decode_strings(s: str) -> List[str]:
-    result = ArrayList()
+    result: List[str] = []
     i = 0
-    while i < len(s):
-        j = i
-        while s[j] != "#":
-            j += 1
+    n = len(s)
+    while i < n:
+        j = s.find("#", i)
         length = int(s[i:j])
         start = j + 1
-        result.add(s[start:start + length])
+        result.append(s[start:start + length])
         i = start + length
-    return result.to_list()
+    return result
 
 
 def max_depth_binary_tree(root: Optional[TreeNode]) -> int:
@@ -1,11 +1,16 @@
+import hashlib
+import json
 import os
-import random
 
 import genanki
 
 
-MODEL_ID = random.randrange(1 << 30, 1 << 31)
-DECK_ID = random.randrange(1 << 30, 1 << 31)
+# Fixed IDs so re-importing a regenerated deck updates the existing note type
+# and deck in Anki (keeping review history) instead of creating duplicates.
+MODEL_ID = 1607392321
+# Chosen at random; must not reuse the anki-generator deck IDs
+# (GeneratorConfig.deck_id_base and TRACK_DECK_IDS, 2059400110-2059400113).
+DECK_ID = 2004863997
 
 
 cloze_model = genanki.Model(
@@ -32,404 +37,368 @@ deck = genanki.Deck(
 )
 
 
-cloze_cards = [
+# Parallel tuples: CLOZE_TEXTS[i] and CLOZE_EXTRAS[i] are the two fields of
+# card i + 1. Sentences are kept as literals rather than rendered from a
+# template because they do not share a common scaffold.
+CLOZE_TEXTS = (
     # 1
-    {
-        "text": "Python lists store elements in {{c1::contiguous memory}}, enabling {{c2::O(1)}} random access.",
-        "extra": "Array-style layout allows pointer arithmetic for index lookup.",
-    },
+    "Python lists store elements in {{c1::contiguous memory}}, enabling {{c2::O(1)}} random access.",
     # 2
-    {
-        "text": "Dynamic array append is {{c1::amortized O(1)}} because capacity grows by {{c2::resizing}} in chunks.",
-        "extra": "Occasional O(n) resize is spread across many inserts.",
-    },
+    "Dynamic array append is {{c1::amortized O(1)}} because capacity grows by {{c2::resizing}} in chunks.",
     # 3
-    {
-        "text": "Inserting into the middle of an array is {{c1::O(n)}} due to {{c2::shifting elements}} to the right.",
-        "extra": "Shift cost grows with the number of trailing elements.",
-    },
+    "Inserting into the middle of an array is {{c1::O(n)}} due to {{c2::shifting elements}} to the right.",
     # 4
-    {
-        "text": "Deleting from the middle of an array is {{c1::O(n)}} because elements must be {{c2::shifted left}}.",
-        "extra": "Only deleting from the end is O(1).",
-    },
+    "Deleting from the middle of an array is {{c1::O(n)}} because elements must be {{c2::shifted left}}.",
     # 5
-    {
-        "text": "Array slicing like arr[a:b] creates a {{c1::new list}} and runs in {{c2::O(k)}} for k elements.",
-        "extra": "Slicing is a shallow copy.",
-    },
+    "Array slicing like arr[a:b] creates a {{c1::new list}} and runs in {{c2::O(k)}} for k elements.",
     # 6
-    {
-        "text": "The expression arr[:] returns a {{c1::shallow copy}} of the list, not a {{c2::view}}.",
-        "extra": "Nested objects are still shared.",
-    },
+    "The expression arr[:] returns a {{c1::shallow copy}} of the list, not a {{c2::view}}.",
     # 7
-    {
-        "text": "Negative indices count from the {{c1::end}} of the list, so arr[-1] is the {{c2::last element}}.",
-        "extra": "arr[-2] is the second to last element.",
-    },
+    "Negative indices count from the {{c1::end}} of the list, so arr[-1] is the {{c2::last element}}.",
     # 8
-    {
-        "text": "Two pointers on a sorted array move {{c1::inward}} to find target sums in {{c2::O(n)}} time.",
-        "extra": "Increase left for a larger sum, decrease right for a smaller sum.",
-    },
+    "Two pointers on a sorted array move {{c1::inward}} to find target sums in {{c2::O(n)}} time.",
     # 9
-    {
-        "text": "Removing duplicates from a sorted array uses {{c1::slow/fast pointers}} and runs in {{c2::O(n)}} time.",
-        "extra": "Slow marks the next unique position.",
-    },
+    "Removing duplicates from a sorted array uses {{c1::slow/fast pointers}} and runs in {{c2::O(n)}} time.",
     # 10
-    {
-        "text": "For the container-with-most-water problem, always move the {{c1::shorter}} pointer because it {{c2::limits the area}}.",
-        "extra": "Moving the taller pointer cannot increase height.",
-    },
+    "For the container-with-most-water problem, always move the {{c1::shorter}} pointer because it {{c2::limits the area}}.",
     # 11
-    {
-        "text": "Dutch National Flag uses {{c1::three pointers}} (low, mid, high) to partition in {{c2::O(n)}} time.",
-        "extra": "Do not advance mid after swapping with high.",
-    },
+    "Dutch National Flag uses {{c1::three pointers}} (low, mid, high) to partition in {{c2::O(n)}} time.",
     # 12
-    {
-        "text": "Sliding window runs in {{c1::O(n)}} because each element is added once and {{c2::removed once}}.",
-        "extra": "The window expands with right and shrinks with left.",
-    },
+    "Sliding window runs in {{c1::O(n)}} because each element is added once and {{c2::removed once}}.",
     # 13
-    {
-        "text": "Longest substring without repeats tracks {{c1::last seen index}} to jump the {{c2::left pointer}}.",
-        "extra": "Prevents scanning characters twice.",
-    },
+    "Longest substring without repeats tracks {{c1::last seen index}} to jump the {{c2::left pointer}}.",
     # 14
-    {
-        "text": "Minimum window substring uses a {{c1::formed counter}} so validity checks are {{c2::O(1)}}.",
-        "extra": "Track counts for required characters.",
-    },
+    "Minimum window substring uses a {{c1::formed counter}} so validity checks are {{c2::O(1)}}.",
     # 15
-    {
-        "text": "With negatives, longest subarray sum k uses {{c1::prefix sums}} and a {{c2::hash map}}.",
-        "extra": "Look for current_sum - k in the map.",
-    },
+    "With negatives, longest subarray sum k uses {{c1::prefix sums}} and a {{c2::hash map}}.",
     # 16
-    {
-        "text": "A stack is {{c1::LIFO}}; push and pop are {{c2::O(1)}} operations.",
-        "extra": "Access is restricted to the top element.",
-    },
+    "A stack is {{c1::LIFO}}; push and pop are {{c2::O(1)}} operations.",
     # 17
-    {
-        "text": "Valid parentheses uses a stack to match {{c1::opening}} with {{c2::closing}} brackets.",
-        "extra": "The stack must be empty at the end.",
-    },
+    "Valid parentheses uses a stack to match {{c1::opening}} with {{c2::closing}} brackets.",
     # 18
-    {
-        "text": "A monotonic stack maintains {{c1::sorted order}} to answer next greater elements in {{c2::O(n)}}.",
-        "extra": "Each index is pushed and popped at most once.",
-    },
+    "A monotonic stack maintains {{c1::sorted order}} to answer next greater elements in {{c2::O(n)}}.",
     # 19
-    {
-        "text": "Daily temperatures stores {{c1::indices}} of a decreasing stack and fills answer when a {{c2::warmer}} day appears.",
-        "extra": "Distances come from current index minus previous index.",
-    },
+    "Daily temperatures stores {{c1::indices}} of a decreasing stack and fills answer when a {{c2::warmer}} day appears.",
     # 20
-    {
-        "text": "Reverse Polish Notation evaluates by popping {{c1::two operands}}; order matters for {{c2::- and /}}.",
-        "extra": "Use a stack of integers.",
-    },
+    "Reverse Polish Notation evaluates by popping {{c1::two operands}}; order matters for {{c2::- and /}}.",
     # 21
-    {
-        "text": "Decoding k[...], on ']' pop until {{c1::'['}}, then repeat the substring {{c2::k times}}.",
-        "extra": "A stack handles nesting depth.",
-    },
+    "Decoding k[...], on ']' pop until {{c1::'['}}, then repeat the substring {{c2::k times}}.",
     # 22
-    {
-        "text": "Asteroid collision uses a stack of {{c1::right-moving}} asteroids; collisions occur with {{c2::left-moving}} ones.",
-        "extra": "Continue until current is destroyed or stack is clear.",
-    },
+    "Asteroid collision uses a stack of {{c1::right-moving}} asteroids; collisions occur with {{c2::left-moving}} ones.",
     # 23
-    {
-        "text": "A queue is {{c1::FIFO}}; enqueue at {{c2::rear}} and dequeue from front.",
-        "extra": "Opposite access discipline of a stack.",
-    },
+    "A queue is {{c1::FIFO}}; enqueue at {{c2::rear}} and dequeue from front.",
     # 24
-    {
-        "text": "Array-based queue dequeue is {{c1::O(n)}} because elements {{c2::shift left}}.",
-        "extra": "Avoid shifting by using a head index or circular buffer.",
-    },
+    "Array-based queue dequeue is {{c1::O(n)}} because elements {{c2::shift left}}.",
     # 25
-    {
-        "text": "Two-stack queue is {{c1::amortized O(1)}} since each element moves at most {{c2::twice}}.",
-        "extra": "Transfer only when output stack is empty.",
-    },
+    "Two-stack queue is {{c1::amortized O(1)}} since each element moves at most {{c2::twice}}.",
     # 26
-    {
-        "text": "Circular queue uses modulo: new_index = {{c1::(index + 1) % capacity}} to {{c2::wrap around}}.",
-        "extra": "Track size to distinguish full from empty.",
-    },
+    "Circular queue uses modulo: new_index = {{c1::(index + 1) % capacity}} to {{c2::wrap around}}.",
     # 27
-    {
-        "text": "BFS processes nodes level by level using a {{c1::queue}} and a {{c2::level_size}} loop.",
-        "extra": "Level size isolates each depth for per-level logic.",
-    },
+    "BFS processes nodes level by level using a {{c1::queue}} and a {{c2::level_size}} loop.",
     # 28
-    {
-        "text": "Linked list nodes are {{c1::non-contiguous}} in memory, so random access is {{c2::O(n)}}.",
-        "extra": "Must traverse from the head.",
-    },
+    "Linked list nodes are {{c1::non-contiguous}} in memory, so random access is {{c2::O(n)}}.",
     # 29
-    {
-        "text": "In a singly linked list, inserting at the {{c1::head}} is {{c2::O(1)}}.",
-        "extra": "No traversal needed when head pointer is known.",
-    },
+    "In a singly linked list, inserting at the {{c1::head}} is {{c2::O(1)}}.",
     # 30
-    {
-        "text": "Reversing a linked list iteratively uses {{c1::prev, curr, next}} pointers and runs in {{c2::O(n)}}.",
-        "extra": "Reverse each link one by one.",
-    },
+    "Reversing a linked list iteratively uses {{c1::prev, curr, next}} pointers and runs in {{c2::O(n)}}.",
     # 31
-    {
-        "text": "Fast/slow pointers find the middle because fast moves {{c1::2x}} as fast as slow.",
-        "extra": "When fast hits the end, slow is at mid.",
-    },
+    "Fast/slow pointers find the middle because fast moves {{c1::2x}} as fast as slow.",
     # 32
-    {
-        "text": "Cycle detection (Floyd) works because in a cycle fast gains {{c1::1 step}} per iteration, so {{c2::they meet}}.",
-        "extra": "If no cycle, fast reaches None.",
-    },
+    "Cycle detection (Floyd) works because in a cycle fast gains {{c1::1 step}} per iteration, so {{c2::they meet}}.",
     # 33
-    {
-        "text": "To find cycle start, reset one pointer to {{c1::head}} and move both {{c2::one step}}.",
-        "extra": "They meet at the entry point.",
-    },
+    "To find cycle start, reset one pointer to {{c1::head}} and move both {{c2::one step}}.",
     # 34
-    {
-        "text": "Remove nth from end by keeping a {{c1::gap of n+1}} between fast and slow, using a {{c2::dummy node}}.",
-        "extra": "Slow lands just before the target.",
-    },
+    "Remove nth from end by keeping a {{c1::gap of n+1}} between fast and slow, using a {{c2::dummy node}}.",
     # 35
-    {
-        "text": "Merge two sorted lists with a {{c1::dummy head}} to avoid special cases for the {{c2::first node}}.",
-        "extra": "Advance the pointer with the smaller value.",
-    },
+    "Merge two sorted lists with a {{c1::dummy head}} to avoid special cases for the {{c2::first node}}.",
     # 36
-    {
-        "text": "Palindrome list: find middle, {{c1::reverse second half}}, then {{c2::compare halves}}.",
-        "extra": "Optional restore by reversing again.",
-    },
+    "Palindrome list: find middle, {{c1::reverse second half}}, then {{c2::compare halves}}.",
     # 37
-    {
-        "text": "Reorder list L0->Ln->L1... uses {{c1::find middle}}, {{c2::reverse second half}}, then merge.",
-        "extra": "Combines multiple linked list patterns.",
-    },
+    "Reorder list L0->Ln->L1... uses {{c1::find middle}}, {{c2::reverse second half}}, then merge.",
     # 38
-    {
-        "text": "Add two numbers as lists by tracking {{c1::carry}} while traversing both lists until {{c2::exhausted}}.",
-        "extra": "Process least significant digits first.",
-    },
+    "Add two numbers as lists by tracking {{c1::carry}} while traversing both lists until {{c2::exhausted}}.",
     # 39
-    {
-        "text": "Merge sort suits linked lists because it avoids {{c1::random access}} and merges in {{c2::O(1) space}}.",
-        "extra": "Split with fast/slow and merge sorted halves.",
-    },
+    "Merge sort suits linked lists because it avoids {{c1::random access}} and merges in {{c2::O(1) space}}.",
     # 40
-    {
-        "text": "Reverse k-group first checks there are {{c1::k nodes}}; otherwise leave the tail {{c2::unchanged}}.",
-        "extra": "Prevents partial reversal.",
-    },
+    "Reverse k-group first checks there are {{c1::k nodes}}; otherwise leave the tail {{c2::unchanged}}.",
     # 41
-    {
-        "text": "Rotate list by k: connect tail to head to form a {{c1::cycle}}, then break at {{c2::length - k}}.",
-        "extra": "Use k % length to optimize large k.",
-    },
+    "Rotate list by k: connect tail to head to form a {{c1::cycle}}, then break at {{c2::length - k}}.",
     # 42
-    {
-        "text": "Array access arr[i] uses {{c1::base + i * size}} to compute {{c2::address}}.",
-        "extra": "Pointer arithmetic enables O(1) indexing.",
-    },
+    "Array access arr[i] uses {{c1::base + i * size}} to compute {{c2::address}}.",
     # 43
-    {
-        "text": "Appending to an array may trigger {{c1::resize}} which copies all elements in {{c2::O(n)}}.",
-        "extra": "This happens infrequently.",
-    },
+    "Appending to an array may trigger {{c1::resize}} which copies all elements in {{c2::O(n)}}.",
     # 44
-    {
-        "text": "A list pop from the end is {{c1::O(1)}}, while pop from the middle is {{c2::O(n)}}.",
-        "extra": "Middle removal shifts elements.",
-    },
+    "A list pop from the end is {{c1::O(1)}}, while pop from the middle is {{c2::O(n)}}.",
     # 45
-    {
-        "text": "Two pointers for sorted two-sum: if sum &lt; target move {{c1::left}}; if sum &gt; target move {{c2::right}}.",
-        "extra": "Sorted order enables monotonic adjustments.",
-    },
+    "Two pointers for sorted two-sum: if sum &lt; target move {{c1::left}}; if sum &gt; target move {{c2::right}}.",
     # 46
-    {
-        "text": "Sliding window for fixed size k updates sum by {{c1::add right}} and {{c2::subtract left}}.",
-        "extra": "Avoid recomputing the whole window.",
-    },
+    "Sliding window for fixed size k updates sum by {{c1::add right}} and {{c2::subtract left}}.",
     # 47
-    {
-        "text": "A deque supports {{c1::O(1)}} insertions/removals at {{c2::both ends}}.",
-        "extra": "Useful for window max/min with indices.",
-    },
+    "A deque supports {{c1::O(1)}} insertions/removals at {{c2::both ends}}.",
     # 48
-    {
-        "text": "Monotonic queue for window max keeps values in {{c1::decreasing}} order and drops out-of-window {{c2::indices}}.",
-        "extra": "Front holds the current maximum.",
-    },
+    "Monotonic queue for window max keeps values in {{c1::decreasing}} order and drops out-of-window {{c2::indices}}.",
     # 49
-    {
-        "text": "Balanced parentheses: when a closing bracket appears, it must match the {{c1::top}} of the {{c2::stack}}.",
-        "extra": "Otherwise the string is invalid.",
-    },
+    "Balanced parentheses: when a closing bracket appears, it must match the {{c1::top}} of the {{c2::stack}}.",
     # 50
-    {
-        "text": "Stack-based DFS pushes neighbors and marks {{c1::visited}} to avoid {{c2::cycles}}.",
-        "extra": "Works similarly to recursive DFS.",
-    },
+    "Stack-based DFS pushes neighbors and marks {{c1::visited}} to avoid {{c2::cycles}}.",
     # 51
-    {
-        "text": "Queue-based BFS guarantees {{c1::shortest path}} in unweighted graphs because it explores by {{c2::levels}}.",
-        "extra": "Each edge is processed at most twice.",
-    },
+    "Queue-based BFS guarantees {{c1::shortest path}} in unweighted graphs because it explores by {{c2::levels}}.",
     # 52
-    {
-        "text": "Linked list deletion needs access to the {{c1::previous node}} to update its {{c2::next}} pointer.",
-        "extra": "Use a dummy node to simplify head removal.",
-    },
+    "Linked list deletion needs access to the {{c1::previous node}} to update its {{c2::next}} pointer.",
     # 53
-    {
-        "text": "Detect intersection of two linked lists by aligning lengths and advancing the {{c1::longer}} list by {{c2::diff}}.",
-        "extra": "Then move both pointers together.",
-    },
+    "Detect intersection of two linked lists by aligning lengths and advancing the {{c1::longer}} list by {{c2::diff}}.",
     # 54
-    {
-        "text": "Another intersection method: pointer A goes to {{c1::headB}} at end, pointer B to {{c2::headA}}.",
-        "extra": "They meet at intersection or None.",
-    },
+    "Another intersection method: pointer A goes to {{c1::headB}} at end, pointer B to {{c2::headA}}.",
     # 55
-    {
-        "text": "Remove duplicates from a sorted linked list by skipping nodes where current.val {{c1::== next.val}}.",
-        "extra": "Only one pass needed.",
-    },
+    "Remove duplicates from a sorted linked list by skipping nodes where current.val {{c1::== next.val}}.",
     # 56
-    {
-        "text": "Partition list around x by building {{c1::before}} and {{c2::after}} lists and concatenating.",
-        "extra": "Preserves relative order within each partition.",
-    },
+    "Partition list around x by building {{c1::before}} and {{c2::after}} lists and concatenating.",
     # 57
-    {
-        "text": "Find kth from end using two pointers with a {{c1::k}} node gap; when fast hits end, slow is at {{c2::kth}}.",
-        "extra": "Same pattern as remove nth from end.",
-    },
+    "Find kth from end using two pointers with a {{c1::k}} node gap; when fast hits end, slow is at {{c2::kth}}.",
     # 58
-    {
-        "text": "In a circular queue, empty is when size == {{c1::0}}, full is when size == {{c2::capacity}}.",
-        "extra": "Size avoids ambiguity between front and rear.",
-    },
+    "In a circular queue, empty is when size == {{c1::0}}, full is when size == {{c2::capacity}}.",
     # 59
-    {
-        "text": "A stack can be implemented with a list using append as {{c1::push}} and pop as {{c2::pop}}.",
-        "extra": "Both operations are O(1).",
-    },
+    "A stack can be implemented with a list using append as {{c1::push}} and pop as {{c2::pop}}.",
     # 60
-    {
-        "text": "For queue with head index, memory can grow because old items are not {{c1::removed}}; occasionally {{c2::compact}}.",
-        "extra": "Circular buffer avoids this issue.",
-    },
+    "For queue with head index, memory can grow because old items are not {{c1::removed}}; occasionally {{c2::compact}}.",
     # 61
-    {
-        "text": "In BFS level order, process exactly {{c1::level_size}} nodes to keep level boundaries {{c2::intact}}.",
-        "extra": "Enqueue children as you go.",
-    },
+    "In BFS level order, process exactly {{c1::level_size}} nodes to keep level boundaries {{c2::intact}}.",
     # 62
-    {
-        "text": "An array of objects uses {{c1::references}}; copying the array does not {{c2::clone}} the objects.",
-        "extra": "Shallow copy shares inner objects.",
-    },
+    "An array of objects uses {{c1::references}}; copying the array does not {{c2::clone}} the objects.",
     # 63
-    {
-        "text": "When reversing k nodes, the original head becomes the {{c1::tail}} of that group and should point to the {{c2::next group}}.",
-        "extra": "Connect groups carefully.",
-    },
+    "When reversing k nodes, the original head becomes the {{c1::tail}} of that group and should point to the {{c2::next group}}.",
     # 64
-    {
-        "text": "In decode-string, numbers may be {{c1::multiple digits}}; read them until a {{c2::non-digit}}.",
-        "extra": "Supports patterns like 12[ab].",
-    },
+    "In decode-string, numbers may be {{c1::multiple digits}}; read them until a {{c2::non-digit}}.",
     # 65
-    {
-        "text": "Monotonic stack for next smaller keeps elements in {{c1::increasing}} order, popping while current is {{c2::smaller}}.",
-        "extra": "Mirror of next greater pattern.",
-    },
+    "Monotonic stack for next smaller keeps elements in {{c1::increasing}} order, popping while current is {{c2::smaller}}.",
     # 66
-    {
-        "text": "In two-sum sorted, once left meets right, the search is {{c1::complete}} because all pairs have been {{c2::tested}}.",
-        "extra": "Pointers move monotonically.",
-    },
+    "In two-sum sorted, once left meets right, the search is {{c1::complete}} because all pairs have been {{c2::tested}}.",
     # 67
-    {
-        "text": "Sliding window max with deque stores {{c1::indices}} so you can drop items that are {{c2::out of window}}.",
-        "extra": "Front is always the max index.",
-    },
+    "Sliding window max with deque stores {{c1::indices}} so you can drop items that are {{c2::out of window}}.",
     # 68
-    {
-        "text": "Linked list insertion after a node is {{c1::O(1)}} once the node is found; finding it is {{c2::O(n)}}.",
-        "extra": "Traversal dominates cost.",
-    },
+    "Linked list insertion after a node is {{c1::O(1)}} once the node is found; finding it is {{c2::O(n)}}.",
     # 69
-    {
-        "text": "Deleting a node with only its pointer (no head) copies value from {{c1::next}} and bypasses {{c2::next.next}}.",
-        "extra": "Cannot delete the tail this way.",
-    },
+    "Deleting a node with only its pointer (no head) copies value from {{c1::next}} and bypasses {{c2::next.next}}.",
     # 70
-    {
-        "text": "A stack can track minimum by storing pairs of {{c1::value}} and {{c2::current min}}.",
-        "extra": "Min retrieval is O(1).",
-    },
+    "A stack can track minimum by storing pairs of {{c1::value}} and {{c2::current min}}.",
     # 71
-    {
-        "text": "Queue using two stacks: on dequeue, if output stack is empty, {{c1::transfer}} all elements from input, reversing {{c2::order}}.",
-        "extra": "Maintains FIFO behavior.",
-    },
+    "Queue using two stacks: on dequeue, if output stack is empty, {{c1::transfer}} all elements from input, reversing {{c2::order}}.",
     # 72
-    {
-        "text": "Time complexity of BFS on adjacency list is {{c1::O(V+E)}} because each vertex and edge is {{c2::processed once}}.",
-        "extra": "Queue operations are O(1).",
-    },
+    "Time complexity of BFS on adjacency list is {{c1::O(V+E)}} because each vertex and edge is {{c2::processed once}}.",
     # 73
-    {
-        "text": "List resizing often doubles capacity to keep amortized insertions at {{c1::O(1)}} with a constant {{c2::growth factor}}.",
-        "extra": "Common strategy in dynamic arrays.",
-    },
+    "List resizing often doubles capacity to keep amortized insertions at {{c1::O(1)}} with a constant {{c2::growth factor}}.",
     # 74
-    {
-        "text": "For a palindrome list, if you reverse the second half, comparison only needs {{c1::half}} the nodes and remains {{c2::O(n)}}.",
-        "extra": "Early exit on mismatch.",
-    },
+    "For a palindrome list, if you reverse the second half, comparison only needs {{c1::half}} the nodes and remains {{c2::O(n)}}.",
     # 75
-    {
-        "text": "In a singly linked list, to remove head safely, use a {{c1::dummy}} node and return {{c2::dummy.next}}.",
-        "extra": "Simplifies edge cases.",
-    },
-]
+    "In a singly linked list, to remove head safely, use a {{c1::dummy}} node and return {{c2::dummy.next}}.",
+)
 
 
-if len(cloze_cards) < 75:
-    raise ValueError(f"Need at least 75 cards, got {len(cloze_cards)}")
+CLOZE_EXTRAS = (
+    # 1
+    "Array-style layout allows pointer arithmetic for index lookup.",
+    # 2
+    "Occasional O(n) resize is spread across many inserts.",
+    # 3
+    "Shift cost grows with the number of trailing elements.",
+    # 4
+    "Only deleting from the end is O(1).",
+    # 5
+    "Slicing is a shallow copy.",
+    # 6
+    "Nested objects are still shared.",
+    # 7
+    "arr[-2] is the second to last element.",
+    # 8
+    "Increase left for a larger sum, decrease right for a smaller sum.",
+    # 9
+    "Slow marks the next unique position.",
+    # 10
+    "Moving the taller pointer cannot increase height.",
+    # 11
+    "Do not advance mid after swapping with high.",
+    # 12
+    "The window expands with right and shrinks with left.",
+    # 13
+    "Prevents scanning characters twice.",
+    # 14
+    "Track counts for required characters.",
+    # 15
+    "Look for current_sum - k in the map.",
+    # 16
+    "Access is restricted to the top element.",
+    # 17
+    "The stack must be empty at the end.",
+    # 18
+    "Each index is pushed and popped at most once.",
+    # 19
+    "Distances come from current index minus previous index.",
+    # 20
+    "Use a stack of integers.",
+    # 21
+    "A stack handles nesting depth.",
+    # 22
+    "Continue until current is destroyed or stack is clear.",
+    # 23
+    "Opposite access discipline of a stack.",
+    # 24
+    "Avoid shifting by using a head index or circular buffer.",
+    # 25
+    "Transfer only when output stack is empty.",
+    # 26
+    "Track size to distinguish full from empty.",
+    # 27
+    "Level size isolates each depth for per-level logic.",
+    # 28
+    "Must traverse from the head.",
+    # 29
+    "No traversal needed when head pointer is known.",
+    # 30
+    "Reverse each link one by one.",
+    # 31
+    "When fast hits the end, slow is at mid.",
+    # 32
+    "If no cycle, fast reaches None.",
+    # 33
+    "They meet at the entry point.",
+    # 34
+    "Slow lands just before the target.",
+    # 35
+    "Advance the pointer with the smaller value.",
+    # 36
+    "Optional restore by reversing again.",
+    # 37
+    "Combines multiple linked list patterns.",
+    # 38
+    "Process least significant digits first.",
+    # 39
+    "Split with fast/slow and merge sorted halves.",
+    # 40
+    "Prevents partial reversal.",
+    # 41
+    "Use k % length to optimize large k.",
+    # 42
+    "Pointer arithmetic enables O(1) indexing.",
+    # 43
+    "This happens infrequently.",
+    # 44
+    "Middle removal shifts elements.",
+    # 45
+    "Sorted order enables monotonic adjustments.",
+    # 46
+    "Avoid recomputing the whole window.",
+    # 47
+    "Useful for window max/min with indices.",
+    # 48
+    "Front holds the current maximum.",
+    # 49
+    "Otherwise the string is invalid.",
+    # 50
+    "Works similarly to recursive DFS.",
+    # 51
+    "Each edge is processed at most twice.",
+    # 52
+    "Use a dummy node to simplify head removal.",
+    # 53
+    "Then move both pointers together.",
+    # 54
+    "They meet at intersection or None.",
+    # 55
+    "Only one pass needed.",
+    # 56
+    "Preserves relative order within each partition.",
+    # 57
+    "Same pattern as remove nth from end.",
+    # 58
+    "Size avoids ambiguity between front and rear.",
+    # 59
+    "Both operations are O(1).",
+    # 60
+    "Circular buffer avoids this issue.",
+    # 61
+    "Enqueue children as you go.",
+    # 62
+    "Shallow copy shares inner objects.",
+    # 63
+    "Connect groups carefully.",
+    # 64
+    "Supports patterns like 12[ab].",
+    # 65
+    "Mirror of next greater pattern.",
+    # 66
+    "Pointers move monotonically.",
+    # 67
+    "Front is always the max index.",
+    # 68
+    "Traversal dominates cost.",
+    # 69
+    "Cannot delete the tail this way.",
+    # 70
+    "Min retrieval is O(1).",
+    # 71
+    "Maintains FIFO behavior.",
+    # 72
+    "Queue operations are O(1).",
+    # 73
+    "Common strategy in dynamic arrays.",
+    # 74
+    "Early exit on mismatch.",
+    # 75
+    "Simplifies edge cases.",
+)
 
 
-for card in cloze_cards:
-    note = genanki.Note(
-        model=cloze_model,
-        fields=[card["text"], card["extra"]],
+if len(CLOZE_TEXTS) != len(CLOZE_EXTRAS):
+    raise ValueError(
+        f"Text/extra count mismatch: {len(CLOZE_TEXTS)} vs {len(CLOZE_EXTRAS)}"
     )
-    deck.add_note(note)
+if len(CLOZE_TEXTS) < 75:
+    raise ValueError(f"Need at least 75 cards, got {len(CLOZE_TEXTS)}")
+
+
+Note = genanki.Note
+deck.notes.extend(
+    Note(model=cloze_model, fields=[text, extra])
+    for text, extra in zip(CLOZE_TEXTS, CLOZE_EXTRAS)
+)
 
 
 output_path = os.path.join(
     os.path.dirname(__file__),
     "lists_stacks_queues_linkedlists_cloze.apkg",
 )
-package = genanki.Package(deck)
-package.write_to_file(output_path)
+stamp_path = output_path + ".sha256"
+
+# Re-zipping the package dominates runtime, so skip it when neither the
+# cards nor the model/deck definition changed since the last write.
+digest = hashlib.sha256(
+    json.dumps(
+        [
+            MODEL_ID,
+            DECK_ID,
+            deck.name,
+            cloze_model.name,
+            cloze_model.model_type,
+            cloze_model.fields,
+            cloze_model.templates,
+            CLOZE_TEXTS,
+            CLOZE_EXTRAS,
+        ]
+    ).encode("utf-8")
+).hexdigest()
+previous_digest = None
+if os.path.exists(output_path) and os.path.exists(stamp_path):
+    with open(stamp_path, "r", encoding="utf-8") as f:
+        previous_digest = f.read().strip()
+
+if previous_digest == digest:
+    print("Anki deck up to date, skipping.")
+else:
+    package = genanki.Package(deck)
+    package.write_to_file(output_path)
+    with open(stamp_path, "w", encoding="utf-8") as f:
+        f.write(digest)
+    print("Anki deck created.")
 
-print("Anki deck created.")
-print(f"Total cards: {len(cloze_cards)}")
+print(f"Total cards: {len(CLOZE_TEXTS)}")
 print(f"File: {output_path}")
@@ -30,9 +30,18 @@ def extract_python_blocks(lines: List[str]) -> Dict[str, str]:
     blocks = {}
     for node in tree.body:
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            start = node.lineno - 1
+            # node.lineno is the def/class line; include any decorators above it
+            start = min([node.lineno] + [d.lineno for d in node.decorator_list]) - 1
             end = node.end_lineno
             blocks[node.name] = "\n".join(lines[start:end]).rstrip() + "\n"
+        elif (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+        ):
+            start = node.lineno - 1
+            end = node.end_lineno
+            blocks[node.targets[0].id] = "\n".join(lines[start:end]).rstrip() + "\n"
     return blocks
 
 
@@ -122,15 +131,28 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def build_python_header() -> str:
+PY_DS_NAMES = ["ArrayList", "ListNode", "Stack", "Queue", "TreeNode", "MinHeap", "MaxHeap"]
+
+
+def build_python_header(body: str) -> str:
+    typing_import = "from typing import List, Dict, Optional, Tuple\n\n"
+    if re.search(r"\blru_cache\b", body):
+        typing_import = "from functools import lru_cache\n" + typing_import
+    if re.search(r"\bdeque\b", body):
+        typing_import = "from collections import deque\n" + typing_import
+    # Only solutions that reference shared data structures pay for the
+    # sys.path setup and the shared.python.ds import.
+    used = [name for name in PY_DS_NAMES if re.search(rf"\b{name}\b", body)]
+    if not used:
+        return typing_import
     return (
         "import os\n"
         "import sys\n"
-        "from typing import List, Dict, Optional, Tuple\n\n"
-        "ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), \"../../../../\"))\n"
+        + typing_import
+        + "ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), \"../../../../\"))\n"
         "if ROOT_DIR not in sys.path:\n"
         "    sys.path.append(ROOT_DIR)\n\n"
-        "from shared.python.ds import ArrayList, ListNode, Stack, Queue, TreeNode, MinHeap, MaxHeap\n\n"
+        f"from shared.python.ds import {', '.join(used)}\n\n"
     )
 
 
@@ -185,19 +207,24 @@ def main() -> None:
         cpp_refs = [part.strip() for part in problem["cpp_ref"].split("/") if part.strip()]
         ts_refs = [part.strip() for part in problem["ts_ref"].split("/") if part.strip()]
 
-        py_content = build_python_header()
+        py_content = ""
         py_helpers = set()
         for ref in py_refs:
             if ref == "clone_graph":
                 py_helpers.add("GraphNode")
             if ref == "Trie":
                 py_helpers.add("TrieNode")
+            if ref == "pacific_atlantic":
+                py_helpers.add("_DIRS")
+            if ref == "climbing_stairs":
+                py_helpers.add("_fib_pair")
             if ref in {"three_sum", "merge_intervals", "non_overlapping_intervals", "meeting_rooms", "meeting_rooms_ii"}:
                 py_helpers.add("_quick_sort")
         for helper in py_helpers:
             py_content += py_blocks[helper]
         for ref in py_refs:
             py_content += py_blocks[ref]
+        py_content = build_python_header(py_content) + py_content
         write_file(os.path.join(ds_dir, "solution.py"), py_content)
 
         ts_content = build_ts_header()
@@ -1,52 +1,49 @@
-import os
-import sys
+from collections import deque
 from typing import List, Dict, Optional, Tuple
 
-ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../"))
-if ROOT_DIR not in sys.path:
-    sys.path.append(ROOT_DIR)
-
-from shared.python.ds import ArrayList, ListNode, Stack, Queue, TreeNode, MinHeap, MaxHeap
-
+_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
 def pacific_atlantic(heights: List[List[int]]) -> List[List[int]]:
     if not heights or not heights[0]:
         return []
     rows = len(heights)
     cols = len(heights[0])
-    pac = [[False] * cols for _ in range(rows)]
-    atl = [[False] * cols for _ in range(rows)]
+    # Flat row-major visited flags, indexed r * cols + c.
+    pac = bytearray(rows * cols)
+    atl = bytearray(rows * cols)
 
-    def dfs(r: int, c: int, visited: List[List[bool]]):
-        visited[r][c] = True
-        dr = [1, -1, 0, 0]
-        dc = [0, 0, 1, -1]
-        i = 0
-        while i < 4:
-            nr = r + dr[i]
-            nc = c + dc[i]
-            if 0 <= nr < rows and 0 <= nc < cols:
-                if not visited[nr][nc] and heights[nr][nc] >= heights[r][c]:
-                    dfs(nr, nc, visited)
-            i += 1
+    def flood(sources: List[Tuple[int, int]], visited: bytearray) -> None:
+        # Multi-source BFS from every border cell of one ocean at once. Cells
+        # are marked when enqueued, so each is expanded at most once.
+        queue = deque()
+        for r, c in sources:
+            idx = r * cols + c
+            if not visited[idx]:
+                visited[idx] = 1
+                queue.append((r, c))
+        while queue:
+            r, c = queue.popleft()
+            h = heights[r][c]
+            for dr, dc in _DIRS:
+                nr = r + dr
+                nc = c + dc
+                if 0 <= nr < rows and 0 <= nc < cols:
+                    nidx = nr * cols + nc
+                    if not visited[nidx] and heights[nr][nc] >= h:
+                        visited[nidx] = 1
+                        queue.append((nr, nc))
 
-    r = 0
-    while r < rows:
-        dfs(r, 0, pac)
-        dfs(r, cols - 1, atl)
-        r += 1
-    c = 0
-    while c < cols:
-        dfs(0, c, pac)
-        dfs(rows - 1, c, atl)
-        c += 1
+    flood([(r, 0) for r in range(rows)] + [(0, c) for c in range(cols)], pac)
+    flood([(r, cols - 1) for r in range(rows)] + [(rows - 1, c) for c in range(cols)], atl)
 
-    result = ArrayList()
+    result: List[List[int]] = []
     r = 0
     while r < rows:
+        row_base = r * cols
         c = 0
         while c < cols:
-            if pac[r][c] and atl[r][c]:
-                result.add([r, c])
+            idx = row_base + c
+            if pac[idx] and atl[idx]:
+                result.append([r, c])
             c += 1
         r += 1
-    return result.to_list()
+    return result
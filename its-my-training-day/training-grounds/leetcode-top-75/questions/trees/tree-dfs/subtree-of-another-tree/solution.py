@@ -6,7 +6,7 @@ ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../
 if ROOT_DIR not in sys.path:
     sys.path.append(ROOT_DIR)
 
-from shared.python.ds import ArrayList, ListNode, Stack, Queue, TreeNode, MinHeap, MaxHeap
+from shared.python.ds import TreeNode
 
 def subtree_of_another_tree(root: Optional[TreeNode], sub_root: Optional[TreeNode]) -> bool:
     def is_same(a: Optional[TreeNode], b: Optional[TreeNode]) -> bool: